@@ -8,6 +8,7 @@ from dppvalidator.exporters.contexts import (
 )
 from dppvalidator.exporters.eudpp_jsonld import (
     EUDPP_CONTEXT_URL,
+    SCHEMA_VERSION_STRING,
     EUDPPJsonLDExporter,
     EUDPPTermMapper,
     export_eudpp_jsonld,
@@ -34,6 +35,7 @@ __all__ = [
     "EUDPPJsonLDExporter",
     "EUDPPTermMapper",
     "EUDPP_CONTEXT_URL",
+    "SCHEMA_VERSION_STRING",
     "export_eudpp_jsonld",
     "export_eudpp_jsonld_dict",
     "get_eudpp_jsonld_context",
@@ -36,6 +36,8 @@ logger = get_logger(__name__)
 
 EUDPP_CONTEXT_URL = "https://dpp.vocabulary-hub.eu/context/v1"
 
+SCHEMA_VERSION_STRING = "CIRPASS-2 v1.3.0"
+
 
 def get_eudpp_jsonld_context() -> list[Any]:
     """Get the EU DPP JSON-LD @context array.
@@ -319,7 +321,7 @@ class EUDPPJsonLDExporter:
         """
         # Add schema reference
         if "schemaVersion" not in data:
-            data["schemaVersion"] = "CIRPASS-2 v1.3.0"
+            data["schemaVersion"] = SCHEMA_VERSION_STRING
 
         # Add status if credential subject has it
         if passport.credential_subject:
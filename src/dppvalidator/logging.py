@@ -22,6 +22,10 @@ from typing import TextIO
 # Package-level logger name
 LOGGER_NAME = "dppvalidator"
 
+# Prefixes that mark a name as already rooted under the package logger;
+# checked with one C-level tuple startswith in get_logger
+_PKG_PREFIXES = (f"{LOGGER_NAME}.", LOGGER_NAME)
+
 # Default format for log messages
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 SIMPLE_FORMAT = "%(levelname)s: %(message)s"
@@ -45,12 +49,10 @@ def get_logger(name: str | None = None) -> logging.Logger:
         return logging.getLogger(LOGGER_NAME)
 
     # Ensure all loggers are children of the package logger
-    if not name.startswith(LOGGER_NAME):
-        if name.startswith("dppvalidator"):
-            return logging.getLogger(name)
-        return logging.getLogger(f"{LOGGER_NAME}.{name}")
+    if name.startswith(_PKG_PREFIXES):
+        return logging.getLogger(name)
 
-    return logging.getLogger(name)
+    return logging.getLogger(f"{LOGGER_NAME}.{name}")
 
 
 def configure_logging(
@@ -8,6 +8,7 @@ from dppvalidator.validators.deep import (
 from dppvalidator.validators.detection import detect_schema_version, is_dpp_document
 from dppvalidator.validators.engine import ValidationEngine
 from dppvalidator.validators.jsonld_semantic import (
+    FilesystemDocumentLoader,
     JSONLDValidator,
     validate_jsonld,
 )
@@ -52,6 +53,7 @@ __all__ = [
     "ModelValidator",
     "SemanticValidator",
     "JSONLDValidator",
+    "FilesystemDocumentLoader",
     "validate_jsonld",
     # Deep validation
     "DeepValidator",
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import json
+import re
 import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from functools import lru_cache
+from hashlib import blake2b, sha1
+from pathlib import Path
 from typing import Any
 
+import httpx
 from pyld import jsonld
 from pyld.jsonld import JsonLdError
 
 from dppvalidator.logging import get_logger
 from dppvalidator.validators.results import ValidationError, ValidationResult
 
+try:  # orjson parses fetched context bytes several times faster
+    from orjson import loads as _loads
+except ImportError:  # pragma: no cover - optional dependency
+    from json import loads as _loads
+
 logger = get_logger(__name__)
 
 # UNTP/UNCEFACT context URL patterns
@@ -21,6 +33,85 @@ UNTP_CONTEXT_PATTERNS = (
     "w3.org/ns/credentials",
 )
 
+# Single compiled alternation over the patterns; one C-level scan of the
+# context string instead of one substring search per pattern
+_UNTP_RE = re.compile("|".join(re.escape(p) for p in UNTP_CONTEXT_PATTERNS))
+
+# Expanded keys with these prefixes are absolute IRIs
+_IRI_PREFIXES = ("http://", "https://")
+
+# JsonLdError codes pyld uses when a document loader fails; these mark a
+# transient fetch problem, not an invalid document
+_LOAD_FAILURE_CODES = frozenset(
+    {
+        "loading document failed",
+        "loading remote context failed",
+    }
+)
+
+# Standard UNTP/VC terms (not exhaustive, common ones); built once at
+# import instead of per _find_unprefixed_custom_terms call
+_STANDARD_TERMS = frozenset(
+    {
+        "type",
+        "id",
+        "@context",
+        "@type",
+        "@id",
+        "credentialSubject",
+        "issuer",
+        "validFrom",
+        "validUntil",
+        "proof",
+        "credentialStatus",
+        "credentialSchema",
+        "name",
+        "description",
+        "image",
+        "product",
+        "manufacturer",
+        "facility",
+        "conformityClaim",
+        "materialsProvenance",
+        "circularityScorecard",
+        "emissionsScorecard",
+        "traceabilityInformation",
+        "guaranteedUntil",
+        "granularityLevel",
+        "serialNumber",
+        "batchNumber",
+        "productCategory",
+        "dimensions",
+        "characteristics",
+        "value",
+        "unit",
+        "code",
+        "schemeId",
+        "schemeName",
+        "massFraction",
+        "recycledContent",
+        "recyclableContent",
+        "hazardous",
+        "materialSafetyInformation",
+        "carbonFootprint",
+        "operationalScope",
+        "originCountry",
+        "materialCode",
+        "materialName",
+    }
+)
+
+# Canonical context IRIs seen in virtually every real DPP; checked with
+# O(1) set membership before falling back to the pattern scan
+_KNOWN_UNTP_URLS = frozenset(
+    {
+        "https://www.w3.org/ns/credentials/v2",
+        "https://test.uncefact.org/vocabulary/untp/dpp/0.6.1/",
+        "https://test.uncefact.org/vocabulary/untp/dpp/0.6.0/",
+        "https://uncefact.org/vocabulary/untp/dpp/0.5.0/",
+    }
+)
+
 # Pre-bundled W3C VC v2 context to avoid network fetch
 # This is the minimal subset needed for DPP validation
 _BUNDLED_VC_V2_CONTEXT = {
@@ -62,26 +153,74 @@ BUNDLED_CONTEXT_URLS = {
 }
 
 
+def _format_path(root: str, segments: tuple[str | int, ...]) -> str:
+    """Materialize a JSON path string from a tuple of path segments.
+
+    Args:
+        root: Root path prefix (usually "$")
+        segments: Key and index segments collected during traversal
+
+    Returns:
+        JSON path string, e.g. "$.credentialSubject['product']"
+    """
+    parts = [root]
+    first = root.endswith("$")
+    for seg in segments:
+        if isinstance(seg, int):
+            parts.append(f"[{seg}]")
+        elif first:
+            parts.append(f".{seg}")
+        else:
+            parts.append(f"['{seg}']")
+        first = False
+    return "".join(parts)
+
+
 class CachingDocumentLoader:
     """Document loader with LRU caching for remote contexts.
 
     Reduces network overhead by caching fetched JSON-LD contexts.
     """
 
-    def __init__(self, cache_size: int = 32, timeout: float = 10.0) -> None:
+    __slots__ = ("_cache", "_cache_size", "_neg_cache", "_negative_ttl", "_timeout")
+
+    def __init__(
+        self,
+        cache_size: int = 32,
+        timeout: float = 10.0,
+        preload_contexts: Mapping[str, dict[str, Any]] | None = None,
+        negative_ttl: float = 30.0,
+    ) -> None:
         """Initialize caching document loader.
 
         Args:
             cache_size: Maximum number of contexts to cache
             timeout: HTTP request timeout in seconds
+            preload_contexts: Extra context documents keyed by URL, seeded
+                into the cache so those URLs are never fetched
+            negative_ttl: Seconds to remember a failed fetch before
+                retrying the URL
         """
         self._cache_size = cache_size
         self._timeout = timeout
-        # Pre-populate cache with bundled contexts
-        self._cache: dict[str, dict[str, Any]] = {
-            url: {"document": ctx, "documentUrl": url, "contextUrl": None}
+        self._negative_ttl = negative_ttl
+        # Failed fetches keyed by URL: (monotonic timestamp, exception
+        # type, exception args). Only the pieces needed to reconstruct
+        # the exception are kept, so no traceback chain stays alive for
+        # the TTL; bounded like the positive cache
+        self._neg_cache: OrderedDict[str, tuple[float, type[Exception], tuple[Any, ...]]] = (
+            OrderedDict()
+        )
+        # Pre-populate cache with bundled contexts; OrderedDict keeps
+        # entries in recency order so eviction removes the least
+        # recently used URL, not just the oldest insertion
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict(
+            (url, {"document": ctx, "documentUrl": url, "contextUrl": None})
             for url, ctx in BUNDLED_CONTEXT_URLS.items()
-        }
+        )
+        if preload_contexts:
+            for url, ctx in preload_contexts.items():
+                self._cache[url] = {"document": ctx, "documentUrl": url, "contextUrl": None}
 
     def __call__(self, url: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
         """Load a remote document, using cache if available.
@@ -95,24 +234,129 @@ class CachingDocumentLoader:
         """
         if url in self._cache:
             logger.debug("Context cache hit: %s", url)
+            self._cache.move_to_end(url)
             return self._cache[url]
 
-        # Use PyLD's default loader for actual fetching
-        result = jsonld.get_document_loader()(url, options)
+        # Raise a recent failure instead of hammering a broken URL; a
+        # fresh exception per caller, since re-raising one shared
+        # instance would keep growing its traceback chain
+        cached_failure = self._neg_cache.get(url)
+        if cached_failure is not None:
+            timestamp, exc_type, exc_args = cached_failure
+            if time.monotonic() - timestamp < self._negative_ttl:
+                logger.debug("Context negative-cache hit: %s", url)
+                try:
+                    exc = exc_type(*exc_args)
+                except TypeError:
+                    # Some exception types (e.g. httpx errors) require
+                    # keyword-only arguments; fall back to a plain error
+                    # carrying the original message
+                    exc = ConnectionError(*exc_args)
+                raise exc
+            del self._neg_cache[url]
 
-        # Cache the result (LRU eviction)
-        if len(self._cache) >= self._cache_size:
-            # Remove oldest entry
-            oldest = next(iter(self._cache))
-            del self._cache[oldest]
+        try:
+            result = self._fetch(url, options)
+        except Exception as e:
+            self._neg_cache[url] = (time.monotonic(), type(e), e.args)
+            if len(self._neg_cache) > self._cache_size:
+                self._neg_cache.popitem(last=False)
+            raise
 
+        # Cache the result, evicting the least recently used entry
         self._cache[url] = result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
         logger.debug("Context cached: %s", url)
         return result
 
+    def _fetch(self, url: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Fetch and parse a remote context document.
+
+        Parsing goes through orjson when installed, which works on the raw
+        response bytes and skips the intermediate UTF-8 decode.
+
+        Args:
+            url: URL to fetch
+            options: PyLD loader options; extra headers are honored
+
+        Returns:
+            Document dict matching PyLD's loader contract
+        """
+        headers = {"Accept": "application/ld+json, application/json"}
+        if options:
+            headers.update(options.get("headers") or {})
+
+        with httpx.Client(timeout=self._timeout, follow_redirects=True) as client:
+            response = client.get(url, headers=headers)
+            response.raise_for_status()
+
+        return {
+            "document": _loads(response.content),
+            "documentUrl": str(response.url),
+            "contextUrl": None,
+        }
+
     def clear_cache(self) -> None:
-        """Clear the context cache."""
+        """Clear the context cache and remembered fetch failures."""
         self._cache.clear()
+        self._neg_cache.clear()
+
+
+class FilesystemDocumentLoader:
+    """Document loader that reads context documents from a local directory.
+
+    Files are looked up as ``<sha1(url)>.jsonld`` under the root
+    directory, so integration tests and offline deployments can resolve
+    contexts without any network access.
+    """
+
+    __slots__ = ("_cache", "_root")
+
+    def __init__(self, root: Path) -> None:
+        """Initialize filesystem document loader.
+
+        Args:
+            root: Directory containing context documents
+        """
+        self._root = Path(root)
+        self._cache: dict[str, dict[str, Any]] = {}
+
+    def __call__(self, url: str, options: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Load a context document from disk.
+
+        Args:
+            url: URL to resolve
+            options: PyLD loader options (unused, accepted for the contract)
+
+        Returns:
+            Document dict with 'document' key containing parsed JSON
+
+        Raises:
+            FileNotFoundError: If no file exists for the URL
+        """
+        del options
+        if url in self._cache:
+            return self._cache[url]
+
+        path = self._root / f"{sha1(url.encode()).hexdigest()}.jsonld"
+        result = {
+            "document": _loads(path.read_bytes()),
+            "documentUrl": url,
+            "contextUrl": None,
+        }
+        self._cache[url] = result
+        return result
+
+
+@lru_cache(maxsize=1)
+def _get_shared_document_loader() -> CachingDocumentLoader:
+    """Get the process-wide shared document loader.
+
+    Sharing one loader keeps JSONLDValidator construction cheap and lets
+    every default-configured validator reuse the same context cache.
+    """
+    return CachingDocumentLoader()
 
 
 class JSONLDValidator:
@@ -134,6 +378,7 @@ class JSONLDValidator:
         schema_version: str = "0.6.1",
         strict: bool = False,
         cache_contexts: bool = True,
+        document_loader: Callable[..., dict[str, Any]] | None = None,
     ) -> None:
         """Initialize JSON-LD validator.
 
@@ -141,20 +386,41 @@ class JSONLDValidator:
             schema_version: UNTP DPP schema version
             strict: If True, undefined terms are errors instead of warnings
             cache_contexts: If True, cache fetched remote contexts
+            document_loader: Custom loader with PyLD's signature (e.g. a
+                FilesystemDocumentLoader); overrides cache_contexts
         """
         self.schema_version = schema_version
         self.strict = strict
-        self._document_loader = CachingDocumentLoader() if cache_contexts else None
-
-    def validate(self, data: dict[str, Any]) -> ValidationResult:
+        if document_loader is not None:
+            self._document_loader = document_loader
+        else:
+            self._document_loader = _get_shared_document_loader() if cache_contexts else None
+        # Batch-scoped IRI intern table; set by validate_many so documents
+        # with overlapping vocabularies share one string object per IRI
+        self._iri_intern: dict[str, str] | None = None
+        # Memoized results keyed by content hash; validation is
+        # deterministic in the input document, so re-validating identical
+        # payloads (CI fixtures, watch mode) skips the expansion entirely
+        self._result_cache: OrderedDict[bytes, ValidationResult] = OrderedDict()
+        self._result_cache_size = 128
+
+    def validate(self, data: dict[str, Any], no_cache: bool = False) -> ValidationResult:
         """Validate JSON-LD semantics via expansion.
 
         Args:
             data: Raw DPP JSON data with @context
+            no_cache: If True, bypass the memoized-result cache
 
         Returns:
             ValidationResult with semantic violations
         """
+        cache_key = None if no_cache else self._cache_key(data)
+        if cache_key is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                self._result_cache.move_to_end(cache_key)
+                return cached
+
         start_time = time.perf_counter()
 
         errors: list[ValidationError] = []
@@ -165,11 +431,14 @@ class JSONLDValidator:
         if context_result:
             errors.append(context_result)
             # Cannot proceed without valid context
-            return ValidationResult(
-                valid=False,
-                errors=errors,
-                schema_version=self.schema_version,
-                validation_time_ms=(time.perf_counter() - start_time) * 1000,
+            return self._memoize(
+                cache_key,
+                ValidationResult(
+                    valid=False,
+                    errors=errors,
+                    schema_version=self.schema_version,
+                    validation_time_ms=(time.perf_counter() - start_time) * 1000,
+                ),
             )
 
         # Perform expansion to detect undefined terms
@@ -211,15 +480,31 @@ class JSONLDValidator:
                 )
 
         except JsonLdError as e:
-            errors.append(
-                ValidationError(
-                    path="$['@context']",
-                    message=f"JSON-LD expansion failed: {e}",
-                    code="JLD001",
-                    layer="jsonld",
-                    severity="error",
+            if self._is_load_failure(e):
+                # pyld wraps document-loader failures into JsonLdError, so
+                # a network blip lands here, not in the bare-Exception
+                # branch; classify it as transient JLD004 so it is never
+                # memoized as a permanent verdict
+                warnings.append(
+                    ValidationError(
+                        path="$['@context']",
+                        message=f"JSON-LD context resolution failed: {e}",
+                        code="JLD004",
+                        layer="jsonld",
+                        severity="warning",
+                        suggestion="Check network connectivity or use offline mode",
+                    )
+                )
+            else:
+                errors.append(
+                    ValidationError(
+                        path="$['@context']",
+                        message=f"JSON-LD expansion failed: {e}",
+                        code="JLD001",
+                        layer="jsonld",
+                        severity="error",
+                    )
                 )
-            )
         except Exception as e:
             # Network errors, timeouts, etc.
             warnings.append(
@@ -235,14 +520,69 @@ class JSONLDValidator:
 
         validation_time = (time.perf_counter() - start_time) * 1000
 
-        return ValidationResult(
-            valid=len(errors) == 0,
-            errors=errors,
-            warnings=warnings,
-            schema_version=self.schema_version,
-            validation_time_ms=validation_time,
+        return self._memoize(
+            cache_key,
+            ValidationResult(
+                valid=len(errors) == 0,
+                errors=errors,
+                warnings=warnings,
+                schema_version=self.schema_version,
+                validation_time_ms=validation_time,
+            ),
         )
 
+    @staticmethod
+    def _is_load_failure(error: Exception) -> bool:
+        """Whether a JsonLdError chain stems from a failed document load."""
+        current: Exception | None = error
+        while current is not None:
+            if getattr(current, "code", None) in _LOAD_FAILURE_CODES:
+                return True
+            current = getattr(current, "cause", None)
+        return False
+
+    def _cache_key(self, data: dict[str, Any]) -> bytes | None:
+        """Content hash of a document, or None if it cannot be serialized."""
+        try:
+            canonical = json.dumps(data, sort_keys=True, default=str)
+        except (TypeError, ValueError):
+            return None
+        return blake2b(canonical.encode(), digest_size=16).digest()
+
+    def _memoize(self, cache_key: bytes | None, result: ValidationResult) -> ValidationResult:
+        """Store a result under its content hash, evicting the LRU entry.
+
+        Results carrying the transient JLD004 network-failure warning are
+        never cached: the document loader already bounds failed fetches at
+        its negative TTL, and memoizing such a result would pin one network
+        blip to the document for the life of the validator.
+        """
+        if cache_key is not None and not any(w.code == "JLD004" for w in result.warnings):
+            self._result_cache[cache_key] = result
+            if len(self._result_cache) > self._result_cache_size:
+                self._result_cache.popitem(last=False)
+        return result
+
+    def validate_many(self, docs: Iterable[dict[str, Any]]) -> list[ValidationResult]:
+        """Validate a batch of documents with shared IRI interning.
+
+        Expanded DPPs in one batch largely reference the same vocabulary
+        IRIs; a batch-scoped intern table makes every occurrence of an IRI
+        share one string object instead of allocating a fresh copy per
+        document.
+
+        Args:
+            docs: Raw DPP JSON documents to validate
+
+        Returns:
+            List of ValidationResults in input order
+        """
+        self._iri_intern = {}
+        try:
+            return [self.validate(data) for data in docs]
+        finally:
+            self._iri_intern = None
+
     def _validate_context_presence(self, data: dict[str, Any]) -> ValidationError | None:
         """Validate @context is present and appears valid.
 
@@ -264,11 +604,17 @@ class JSONLDValidator:
                 suggestion="Add @context with UNTP vocabulary URL",
             )
 
-        # Check if context contains UNTP/W3C vocabulary
-        context_str = str(context).lower()
-        has_untp = any(pattern in context_str for pattern in UNTP_CONTEXT_PATTERNS)
+        # Fast path: the common case is a context list naming a canonical IRI
+        if isinstance(context, str):
+            if context in _KNOWN_UNTP_URLS:
+                return None
+        elif isinstance(context, list) and any(
+            url in _KNOWN_UNTP_URLS for url in context if isinstance(url, str)
+        ):
+            return None
 
-        if not has_untp:
+        # Check if context contains UNTP/W3C vocabulary
+        if not _UNTP_RE.search(str(context).lower()):
             return ValidationError(
                 path="$['@context']",
                 message="@context missing UNTP/W3C vocabulary references",
@@ -299,16 +645,13 @@ class JSONLDValidator:
         """
         dropped: list[tuple[str, str]] = []
 
-        # Get all keys from original (excluding JSON-LD keywords)
-        original_keys = self._collect_keys(original, "$")
-
         # Get all expanded IRIs
         expanded_iris: set[str] = set()
         if expanded:
             self._collect_expanded_iris(expanded[0] if expanded else {}, expanded_iris)
 
-        # Check which original keys didn't expand
-        for key, path in original_keys:
+        # Check which original keys (excluding JSON-LD keywords) didn't expand
+        for key, segments in self._iter_keys(original):
             if key.startswith("@"):
                 continue  # Skip JSON-LD keywords
 
@@ -320,7 +663,7 @@ class JSONLDValidator:
 
             if not key_expanded and key not in ("type", "id"):
                 # Also check if it's a standard term that maps to @type or @id
-                dropped.append((key, path))
+                dropped.append((key, _format_path("$", segments)))
 
         return dropped
 
@@ -329,7 +672,7 @@ class JSONLDValidator:
         obj: Any,
         path: str,
     ) -> list[tuple[str, str]]:
-        """Recursively collect all keys from an object.
+        """Collect all keys from an object with materialized path strings.
 
         Args:
             obj: Object to traverse
@@ -338,35 +681,63 @@ class JSONLDValidator:
         Returns:
             List of (key, path) tuples
         """
-        keys: list[tuple[str, str]] = []
+        return [(key, _format_path(path, segments)) for key, segments in self._iter_keys(obj)]
 
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                key_path = f"{path}['{key}']" if not path.endswith("$") else f"$.{key}"
-                if not key.startswith("@"):
-                    keys.append((key, key_path))
-                keys.extend(self._collect_keys(value, key_path))
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                keys.extend(self._collect_keys(item, f"{path}[{i}]"))
+    def _iter_keys(self, obj: Any) -> Iterator[tuple[str, tuple[str | int, ...]]]:
+        """Lazily yield keys and their path segments via iterative DFS.
 
-        return keys
+        An explicit work-list avoids one Python frame per nesting level,
+        so deeply nested passports cannot hit the recursion limit. Paths
+        are yielded as shared segment tuples; callers that only need a
+        path for flagged terms format it on demand with _format_path,
+        skipping one string allocation per visited node.
+
+        Args:
+            obj: Object to traverse
+
+        Yields:
+            (key, path_segments) tuples
+        """
+        stack: deque[tuple[Any, tuple[str | int, ...]]] = deque([(obj, ())])
+
+        while stack:
+            node, segments = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    child = (*segments, key)
+                    if not key.startswith("@"):
+                        yield key, child
+                    stack.append((value, child))
+            elif isinstance(node, list):
+                for i, item in enumerate(node):
+                    stack.append((item, (*segments, i)))
 
     def _collect_expanded_iris(self, obj: Any, iris: set[str]) -> None:
         """Collect all IRIs from expanded JSON-LD.
 
+        Iterates with an explicit stack (no recursion limit on deep
+        expansions) and batches each dict's matching keys into one
+        set.update call instead of adding them one by one.
+
         Args:
             obj: Expanded JSON-LD object
             iris: Set to add IRIs to (mutated)
         """
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if key.startswith("http://") or key.startswith("https://"):
-                    iris.add(key)
-                self._collect_expanded_iris(value, iris)
-        elif isinstance(obj, list):
-            for item in obj:
-                self._collect_expanded_iris(item, iris)
+        intern_table = self._iri_intern
+        stack = [obj]
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                if intern_table is None:
+                    iris.update(k for k in node if k.startswith(_IRI_PREFIXES))
+                else:
+                    iris.update(
+                        intern_table.setdefault(k, k) for k in node if k.startswith(_IRI_PREFIXES)
+                    )
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
 
     def _find_unprefixed_custom_terms(
         self,
@@ -383,70 +754,18 @@ class JSONLDValidator:
         Returns:
             List of (term_name, json_path) tuples
         """
-        # Standard UNTP/VC terms (not exhaustive, common ones)
-        standard_terms = frozenset(
-            {
-                "type",
-                "id",
-                "@context",
-                "@type",
-                "@id",
-                "credentialSubject",
-                "issuer",
-                "validFrom",
-                "validUntil",
-                "proof",
-                "credentialStatus",
-                "credentialSchema",
-                "name",
-                "description",
-                "image",
-                "product",
-                "manufacturer",
-                "facility",
-                "conformityClaim",
-                "materialsProvenance",
-                "circularityScorecard",
-                "emissionsScorecard",
-                "traceabilityInformation",
-                "guaranteedUntil",
-                "granularityLevel",
-                "serialNumber",
-                "batchNumber",
-                "productCategory",
-                "dimensions",
-                "characteristics",
-                "value",
-                "unit",
-                "code",
-                "schemeId",
-                "schemeName",
-                "massFraction",
-                "recycledContent",
-                "recyclableContent",
-                "hazardous",
-                "materialSafetyInformation",
-                "carbonFootprint",
-                "operationalScope",
-                "originCountry",
-                "materialCode",
-                "materialName",
-            }
-        )
-
         unprefixed: list[tuple[str, str]] = []
-        all_keys = self._collect_keys(data, "$")
 
-        for key, path in all_keys:
+        for key, segments in self._iter_keys(data):
             if key.startswith("@"):
                 continue
-            if key in standard_terms:
+            if key in _STANDARD_TERMS:
                 continue
             # Check if prefixed (contains colon but not URL)
             if ":" in key and not key.startswith("http"):
                 continue
             # Likely a custom unprefixed term
-            unprefixed.append((key, path))
+            unprefixed.append((key, _format_path("$", segments)))
 
         return unprefixed
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import reprlib
 import time
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, ClassVar
 
+from pydantic import TypeAdapter
 from pydantic import ValidationError as PydanticValidationError
 
 from dppvalidator.models.passport import DigitalProductPassport
@@ -59,6 +62,12 @@ PYDANTIC_ERROR_CODES: dict[str, str] = {
 # Default code for unmapped error types
 DEFAULT_ERROR_CODE = "MDL099"
 
+# Size-bounded repr for error context; truncates nested values instead of
+# materializing the full string of a large payload first
+_SAFE_REPR = reprlib.Repr()
+_SAFE_REPR.maxstring = 100
+_SAFE_REPR.maxother = 100
+
 
 class ModelValidator:
     """Pydantic model validation layer.
@@ -70,6 +79,16 @@ class ModelValidator:
     name: str = "model"
     layer: str = "model"
 
+    # Compiled validator shared by all instances; built lazily on first use
+    _ADAPTER: ClassVar[TypeAdapter[DigitalProductPassport] | None] = None
+
+    @classmethod
+    def _get_adapter(cls) -> TypeAdapter[DigitalProductPassport]:
+        """Get the shared TypeAdapter, building it on first access."""
+        if cls._ADAPTER is None:
+            cls._ADAPTER = TypeAdapter(DigitalProductPassport)
+        return cls._ADAPTER
+
     def __init__(self, schema_version: str = "0.6.1") -> None:
         """Initialize model validator.
 
@@ -92,24 +111,9 @@ class ModelValidator:
         passport: DigitalProductPassport | None = None
 
         try:
-            passport = DigitalProductPassport.model_validate(data)
+            passport = self._get_adapter().validate_python(data)
         except PydanticValidationError as e:
-            for error in e.errors():
-                json_path = self._loc_to_path(error.get("loc", ()))
-                error_type = error.get("type", "unknown")
-                errors.append(
-                    ValidationError(
-                        path=json_path,
-                        message=error.get("msg", "Validation error"),
-                        code=self._get_error_code(error_type),
-                        layer="model",
-                        severity="error",
-                        context={
-                            "type": error_type,
-                            "input": self._safe_input(error.get("input")),
-                        },
-                    )
-                )
+            errors = self._errors_from_exception(e)
 
         validation_time = (time.perf_counter() - start_time) * 1000
 
@@ -121,6 +125,40 @@ class ModelValidator:
             validation_time_ms=validation_time,
         )
 
+    def validate_many(self, docs: Iterable[dict[str, Any]]) -> list[ValidationResult]:
+        """Validate a batch of documents.
+
+        The compiled adapter is shared class-wide, so per-document cost is
+        dominated by the actual validation.
+
+        Args:
+            docs: Raw JSON documents to validate
+
+        Returns:
+            List of ValidationResults in input order
+        """
+        return [self.validate(data) for data in docs]
+
+    def _errors_from_exception(self, exc: PydanticValidationError) -> list[ValidationError]:
+        """Convert a Pydantic validation error into layer errors."""
+        errors: list[ValidationError] = []
+        for error in exc.errors():
+            error_type = error.get("type", "unknown")
+            errors.append(
+                ValidationError(
+                    path=self._loc_to_path(error.get("loc", ())),
+                    message=error.get("msg", "Validation error"),
+                    code=self._get_error_code(error_type),
+                    layer="model",
+                    severity="error",
+                    context={
+                        "type": error_type,
+                        "input": self._safe_input(error.get("input")),
+                    },
+                )
+            )
+        return errors
+
     def _loc_to_path(self, loc: tuple[Any, ...]) -> str:
         """Convert Pydantic error location to JSON path."""
         path_parts = ["$"]
@@ -132,14 +170,42 @@ class ModelValidator:
         return "".join(path_parts)
 
     def _safe_input(self, value: Any) -> Any:
-        """Safely convert input value for JSON serialization."""
+        """Safely convert input value for JSON serialization.
+
+        Truncation never materializes the full string of a large payload:
+        strings are length-checked and sliced, containers and arbitrary
+        objects go through a size-bounded reprlib.Repr.
+        """
         if value is None:
             return None
-        if isinstance(value, (str, int, float, bool)):
+        if isinstance(value, str):
+            return value if len(value) <= 100 else value[:97] + "..."
+        if isinstance(value, (int, float, bool)):
             return value
         if isinstance(value, (list, dict)):
-            return str(value)[:100] + "..." if len(str(value)) > 100 else value
-        return str(value)[:100]
+            # Small, flat containers of short primitives stay structured
+            # for JSON output; everything else gets the bounded repr
+            if len(value) <= 6 and self._is_short_flat(value):
+                return value
+            text = _SAFE_REPR.repr(value)
+            return text if len(text) <= 100 else text[:97] + "..."
+        return _SAFE_REPR.repr(value)
+
+    @staticmethod
+    def _is_short_flat(container: list[Any] | dict[str, Any]) -> bool:
+        """Whether every element is a primitive short enough to keep structured.
+
+        Inspecting elements directly keeps the decision cheap: calling
+        repr on the container would materialize any unbounded nested
+        string in full.
+        """
+        elements = [*container, *container.values()] if isinstance(container, dict) else container
+        return all(
+            element is None
+            or isinstance(element, (int, float, bool))
+            or (isinstance(element, str) and len(element) <= 20)
+            for element in elements
+        )
 
     def _get_error_code(self, error_type: str) -> str:
         """Get stable error code for a Pydantic error type.
@@ -56,7 +56,7 @@ class ValidationError:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of DPP validation following the Result pattern.
 
@@ -11,9 +11,12 @@ Note: Different namespace from other modules (cea.fr not taltech.ee)
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
+from functools import cache
+from types import MappingProxyType
 from typing import ClassVar
 
 # =============================================================================
@@ -24,6 +27,8 @@ from typing import ClassVar
 LCA_NAMESPACE = "http://dpp.cea.fr/EUDPP/LCA#"
 LCA_PREFIX = "lca"
 
+_LCA_PREFIX_COLON = f"{LCA_PREFIX}:"
+
 
 # =============================================================================
 # LCA Class Enums
@@ -171,24 +176,32 @@ class CharacterizationModel(str, Enum):
 # =============================================================================
 
 
-IMPACT_CATEGORY_UNITS: dict[str, str] = {
-    ImpactCategory.CLIMATE_CHANGE.value: "kg CO2-eq",
-    ImpactCategory.ACIDIFICATION.value: "mol H+-eq",
-    ImpactCategory.EUTROPHICATION_FRESHWATER.value: "kg P-eq",
-    ImpactCategory.EUTROPHICATION_MARINE.value: "kg N-eq",
-    ImpactCategory.EUTROPHICATION_TERRESTRIAL.value: "mol N-eq",
-    ImpactCategory.ECOTOXICITY_FRESHWATER.value: "CTUe",
-    ImpactCategory.HUMAN_TOXICITY_CANCER.value: "CTUh",
-    ImpactCategory.HUMAN_TOXICITY_NON_CANCER.value: "CTUh",
-    ImpactCategory.IONISING_RADIATION.value: "kBq U235-eq",
-    ImpactCategory.LAND_USE.value: "Pt",
-    ImpactCategory.OZONE_DEPLETION.value: "kg CFC-11-eq",
-    ImpactCategory.PARTICULATE_MATTER.value: "disease incidence",
-    ImpactCategory.PHOTOCHEMICAL_OZONE.value: "kg NMVOC-eq",
-    ImpactCategory.RESOURCE_FOSSILS.value: "MJ",
-    ImpactCategory.RESOURCE_MINERALS.value: "kg Sb-eq",
-    ImpactCategory.WATER_USE.value: "m³ world-eq",
-}
+# Read-only view: the str-mixin enum members hash like their values, so
+# lookups work with either a member or a plain URI string.
+IMPACT_CATEGORY_UNITS: Mapping[str, str] = MappingProxyType(
+    {
+        ImpactCategory.CLIMATE_CHANGE.value: "kg CO2-eq",
+        ImpactCategory.ACIDIFICATION.value: "mol H+-eq",
+        ImpactCategory.EUTROPHICATION_FRESHWATER.value: "kg P-eq",
+        ImpactCategory.EUTROPHICATION_MARINE.value: "kg N-eq",
+        ImpactCategory.EUTROPHICATION_TERRESTRIAL.value: "mol N-eq",
+        ImpactCategory.ECOTOXICITY_FRESHWATER.value: "CTUe",
+        ImpactCategory.HUMAN_TOXICITY_CANCER.value: "CTUh",
+        ImpactCategory.HUMAN_TOXICITY_NON_CANCER.value: "CTUh",
+        ImpactCategory.IONISING_RADIATION.value: "kBq U235-eq",
+        ImpactCategory.LAND_USE.value: "Pt",
+        ImpactCategory.OZONE_DEPLETION.value: "kg CFC-11-eq",
+        ImpactCategory.PARTICULATE_MATTER.value: "disease incidence",
+        ImpactCategory.PHOTOCHEMICAL_OZONE.value: "kg NMVOC-eq",
+        ImpactCategory.RESOURCE_FOSSILS.value: "MJ",
+        ImpactCategory.RESOURCE_MINERALS.value: "kg Sb-eq",
+        ImpactCategory.WATER_USE.value: "m³ world-eq",
+    }
+)
+
+
+# All 16 PEF 3.1 category URIs, materialized once at import time.
+_ALL_CATEGORY_URIS: frozenset[str] = frozenset(c.value for c in ImpactCategory)
 
 
 # =============================================================================
@@ -244,7 +257,7 @@ class MaterialFootprint(EnvironmentalFootprint):
     methodology: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class EnvironmentalImpact:
     """Environmental Impact per ESPR Art 2(14).
 
@@ -287,8 +300,7 @@ class ImpactResult:
         errors = []
 
         # Validate category is known
-        valid_categories = [c.value for c in ImpactCategory]
-        if self.category not in valid_categories:
+        if self.category not in _ALL_CATEGORY_URIS:
             errors.append(f"Unknown impact category: {self.category}")
 
         return errors
@@ -312,7 +324,7 @@ class CharacterizationFactor:
     model: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class LCAMethodology:
     """LCA Methodology per PEF framework.
 
@@ -329,7 +341,7 @@ class LCAMethodology:
     description: str | None = None
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class LCAMethod:
     """LCA Method per PEF framework.
 
@@ -363,6 +375,18 @@ class ProductEnvironmentalFootprint:
     methodology_version: str = "PEF 3.1"
     impact_results: tuple[ImpactResult, ...] = ()
 
+    # Category URI -> result index, built once per instance so get_impact
+    # is a dict lookup instead of a scan over impact_results.
+    _impact_index: dict[str, ImpactResult] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Build the category lookup index (frozen, so via object.__setattr__)."""
+        object.__setattr__(
+            self,
+            "_impact_index",
+            {r.category: r for r in self.impact_results},
+        )
+
     def get_impact(self, category: ImpactCategory) -> ImpactResult | None:
         """Get impact result for a specific category.
 
@@ -372,10 +396,7 @@ class ProductEnvironmentalFootprint:
         Returns:
             ImpactResult for the category, or None if not found
         """
-        for result in self.impact_results:
-            if result.category == category.value:
-                return result
-        return None
+        return self._impact_index.get(category.value)
 
     def has_all_categories(self) -> bool:
         """Check if all 16 PEF categories are present.
@@ -383,9 +404,7 @@ class ProductEnvironmentalFootprint:
         Returns:
             True if all categories have results
         """
-        categories_present = {r.category for r in self.impact_results}
-        all_categories = {c.value for c in ImpactCategory}
-        return all_categories.issubset(categories_present)
+        return _ALL_CATEGORY_URIS.issubset(self._impact_index)
 
     def missing_categories(self) -> list[str]:
         """Get list of missing impact categories.
@@ -393,9 +412,7 @@ class ProductEnvironmentalFootprint:
         Returns:
             List of missing category URIs
         """
-        categories_present = {r.category for r in self.impact_results}
-        all_categories = {c.value for c in ImpactCategory}
-        return list(all_categories - categories_present)
+        return sorted(_ALL_CATEGORY_URIS - self._impact_index.keys())
 
 
 # =============================================================================
@@ -403,13 +420,34 @@ class ProductEnvironmentalFootprint:
 # =============================================================================
 
 
-def get_all_impact_categories() -> list[str]:
+_CLIMATE_CATEGORY = ImpactCategory.CLIMATE_CHANGE.value
+
+_TOXICITY_CATEGORIES = frozenset(
+    {
+        ImpactCategory.HUMAN_TOXICITY_CANCER.value,
+        ImpactCategory.HUMAN_TOXICITY_NON_CANCER.value,
+        ImpactCategory.ECOTOXICITY_FRESHWATER.value,
+    }
+)
+
+_RESOURCE_CATEGORIES = frozenset(
+    {
+        ImpactCategory.RESOURCE_FOSSILS.value,
+        ImpactCategory.RESOURCE_MINERALS.value,
+        ImpactCategory.WATER_USE.value,
+        ImpactCategory.LAND_USE.value,
+    }
+)
+
+
+@cache
+def get_all_impact_categories() -> tuple[str, ...]:
     """Get all PEF 3.1 impact category URIs.
 
     Returns:
-        List of 16 impact category URIs
+        Tuple of 16 impact category URIs
     """
-    return [c.value for c in ImpactCategory]
+    return tuple(c.value for c in ImpactCategory)
 
 
 def get_impact_category_unit(category: str) -> str | None:
@@ -424,22 +462,24 @@ def get_impact_category_unit(category: str) -> str | None:
     return IMPACT_CATEGORY_UNITS.get(category)
 
 
-def get_all_characterization_models() -> list[str]:
+@cache
+def get_all_characterization_models() -> tuple[str, ...]:
     """Get all characterization model URIs.
 
     Returns:
-        List of characterization model URIs
+        Tuple of characterization model URIs
     """
-    return [m.value for m in CharacterizationModel]
+    return tuple(m.value for m in CharacterizationModel)
 
 
-def get_all_impact_indicators() -> list[str]:
+@cache
+def get_all_impact_indicators() -> tuple[str, ...]:
     """Get all impact category indicator URIs.
 
     Returns:
-        List of impact category indicator URIs
+        Tuple of impact category indicator URIs
     """
-    return [i.value for i in ImpactCategoryIndicator]
+    return tuple(i.value for i in ImpactCategoryIndicator)
 
 
 def is_climate_related(category: str) -> bool:
@@ -451,7 +491,7 @@ def is_climate_related(category: str) -> bool:
     Returns:
         True if category is climate change
     """
-    return category == ImpactCategory.CLIMATE_CHANGE.value
+    return category == _CLIMATE_CATEGORY
 
 
 def is_toxicity_related(category: str) -> bool:
@@ -463,12 +503,7 @@ def is_toxicity_related(category: str) -> bool:
     Returns:
         True if category relates to human or ecosystem toxicity
     """
-    toxicity_categories = {
-        ImpactCategory.HUMAN_TOXICITY_CANCER.value,
-        ImpactCategory.HUMAN_TOXICITY_NON_CANCER.value,
-        ImpactCategory.ECOTOXICITY_FRESHWATER.value,
-    }
-    return category in toxicity_categories
+    return category in _TOXICITY_CATEGORIES
 
 
 def is_resource_related(category: str) -> bool:
@@ -480,13 +515,7 @@ def is_resource_related(category: str) -> bool:
     Returns:
         True if category relates to resource use
     """
-    resource_categories = {
-        ImpactCategory.RESOURCE_FOSSILS.value,
-        ImpactCategory.RESOURCE_MINERALS.value,
-        ImpactCategory.WATER_USE.value,
-        ImpactCategory.LAND_USE.value,
-    }
-    return category in resource_categories
+    return category in _RESOURCE_CATEGORIES
 
 
 def expand_lca_uri(compact_uri: str) -> str:
@@ -498,8 +527,8 @@ def expand_lca_uri(compact_uri: str) -> str:
     Returns:
         Full URI with namespace
     """
-    if compact_uri.startswith(f"{LCA_PREFIX}:"):
-        return compact_uri.replace(f"{LCA_PREFIX}:", LCA_NAMESPACE)
+    if compact_uri.startswith(_LCA_PREFIX_COLON):
+        return LCA_NAMESPACE + compact_uri.removeprefix(_LCA_PREFIX_COLON)
     return compact_uri
 
 
@@ -513,5 +542,5 @@ def compact_lca_uri(full_uri: str) -> str:
         Compact URI with lca: prefix
     """
     if full_uri.startswith(LCA_NAMESPACE):
-        return full_uri.replace(LCA_NAMESPACE, f"{LCA_PREFIX}:")
+        return _LCA_PREFIX_COLON + full_uri.removeprefix(LCA_NAMESPACE)
     return full_uri
@@ -661,25 +661,18 @@ class ProductRelationMapper:
         return len(DATATYPE_PROPERTIES)
 
 
-def get_product_hierarchy_properties() -> list[str]:
-    """Get URIs of product hierarchy properties.
-
-    Returns:
-        List of transitive product relation URIs
-    """
-    return [
+# Property groupings, materialized once at import time. The getter
+# functions below return these shared frozensets instead of rebuilding
+# a list per call.
+PRODUCT_HIERARCHY_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPObjectProperty.IS_COMPONENT_OF.value,
         EUDPPObjectProperty.IS_SPARE_PART_OF.value,
-    ]
-
-
-def get_actor_properties() -> list[str]:
-    """Get URIs of actor-related properties.
+    }
+)
 
-    Returns:
-        List of actor relation URIs
-    """
-    return [
+ACTOR_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPObjectProperty.HAS_ISSUER.value,
         EUDPPObjectProperty.HAS_MANUFACTURER.value,
         EUDPPObjectProperty.HAS_ECONOMIC_OPERATOR.value,
@@ -692,61 +685,41 @@ def get_actor_properties() -> list[str]:
         EUDPPObjectProperty.IS_RESIDING_IN.value,
         EUDPPObjectProperty.REPRESENTS_MANUFACTURER.value,
         EUDPPObjectProperty.IS_REPRESENTED_BY.value,
-    ]
-
-
-def get_actor_datatype_properties() -> list[str]:
-    """Get URIs of actor datatype properties (Phase 2).
+    }
+)
 
-    Returns:
-        List of actor datatype property URIs
-    """
-    return [
+ACTOR_DATATYPE_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPDatatypeProperty.ACTOR_NAME.value,
         EUDPPDatatypeProperty.ELECTRONIC_CONTACT.value,
         EUDPPDatatypeProperty.POSTAL_ADDRESS.value,
         EUDPPDatatypeProperty.REGISTERED_TRADE_NAME.value,
         EUDPPDatatypeProperty.REGISTERED_TRADEMARK.value,
         EUDPPDatatypeProperty.UNIQUE_OPERATOR_ID.value,
-    ]
-
-
-def get_facility_properties() -> list[str]:
-    """Get URIs of facility-related properties (Phase 2).
+    }
+)
 
-    Returns:
-        List of facility property URIs
-    """
-    return [
+FACILITY_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPObjectProperty.USES_FACILITY.value,
         EUDPPObjectProperty.IS_USED_BY_ACTOR.value,
         EUDPPDatatypeProperty.UNIQUE_FACILITY_ID.value,
-    ]
-
-
-def get_lifecycle_properties() -> list[str]:
-    """Get URIs of DPP lifecycle properties.
+    }
+)
 
-    Returns:
-        List of lifecycle datatype property URIs
-    """
-    return [
+LIFECYCLE_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPDatatypeProperty.VALID_FROM.value,
         EUDPPDatatypeProperty.VALID_UNTIL.value,
         EUDPPDatatypeProperty.LAST_UPDATE.value,
         EUDPPDatatypeProperty.STATUS.value,
         EUDPPDatatypeProperty.SCHEMA_VERSION.value,
         EUDPPDatatypeProperty.LINK_TO_PREVIOUS_DPP.value,
-    ]
-
-
-def get_substance_properties() -> list[str]:
-    """Get URIs of substance of concern properties (Phase 3).
+    }
+)
 
-    Returns:
-        List of SOC property URIs
-    """
-    return [
+SUBSTANCE_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPObjectProperty.CONTAINS_SUBSTANCE_OF_CONCERN.value,
         EUDPPObjectProperty.HAS_CONCENTRATION.value,
         EUDPPObjectProperty.HAS_LIFECYCLE_STAGE.value,
@@ -762,16 +735,11 @@ def get_substance_properties() -> list[str]:
         EUDPPDatatypeProperty.SUBSTANCE_LOCATION.value,
         EUDPPDatatypeProperty.HAS_IMPACT_ON_ENVIRONMENT.value,
         EUDPPDatatypeProperty.HAS_IMPACT_ON_HUMAN_HEALTH.value,
-    ]
-
-
-def get_lca_properties() -> list[str]:
-    """Get URIs of LCA-related properties (Phase 4).
+    }
+)
 
-    Returns:
-        List of LCA property URIs
-    """
-    return [
+LCA_PROPERTIES: frozenset[str] = frozenset(
+    {
         EUDPPObjectProperty.QUANTIFIES.value,
         EUDPPObjectProperty.QUANTIFIED_BY.value,
         EUDPPObjectProperty.ICI_ASSESS_IC.value,
@@ -784,7 +752,71 @@ def get_lca_properties() -> list[str]:
         EUDPPObjectProperty.CORRESPONDS_TO_IC.value,
         EUDPPDatatypeProperty.LCA_HAS_UNIT.value,
         EUDPPDatatypeProperty.LCA_NUMERIC_VALUE.value,
-    ]
+    }
+)
+
+
+def get_product_hierarchy_properties() -> frozenset[str]:
+    """Get URIs of product hierarchy properties.
+
+    Returns:
+        Frozen set of transitive product relation URIs
+    """
+    return PRODUCT_HIERARCHY_PROPERTIES
+
+
+def get_actor_properties() -> frozenset[str]:
+    """Get URIs of actor-related properties.
+
+    Returns:
+        Frozen set of actor relation URIs
+    """
+    return ACTOR_PROPERTIES
+
+
+def get_actor_datatype_properties() -> frozenset[str]:
+    """Get URIs of actor datatype properties (Phase 2).
+
+    Returns:
+        Frozen set of actor datatype property URIs
+    """
+    return ACTOR_DATATYPE_PROPERTIES
+
+
+def get_facility_properties() -> frozenset[str]:
+    """Get URIs of facility-related properties (Phase 2).
+
+    Returns:
+        Frozen set of facility property URIs
+    """
+    return FACILITY_PROPERTIES
+
+
+def get_lifecycle_properties() -> frozenset[str]:
+    """Get URIs of DPP lifecycle properties.
+
+    Returns:
+        Frozen set of lifecycle datatype property URIs
+    """
+    return LIFECYCLE_PROPERTIES
+
+
+def get_substance_properties() -> frozenset[str]:
+    """Get URIs of substance of concern properties (Phase 3).
+
+    Returns:
+        Frozen set of SOC property URIs
+    """
+    return SUBSTANCE_PROPERTIES
+
+
+def get_lca_properties() -> frozenset[str]:
+    """Get URIs of LCA-related properties (Phase 4).
+
+    Returns:
+        Frozen set of LCA property URIs
+    """
+    return LCA_PROPERTIES
 
 
 def is_product_relation(uri: str) -> bool:
@@ -796,4 +828,4 @@ def is_product_relation(uri: str) -> bool:
     Returns:
         True if URI is a product relation property
     """
-    return uri in get_product_hierarchy_properties()
+    return uri in PRODUCT_HIERARCHY_PROPERTIES
@@ -476,12 +476,6 @@ class TestDocument:
         assert doc.content_type is None
         assert doc.web_link is None
 
-    def test_document_immutable(self):
-        """Test document is immutable (frozen)."""
-        doc = Document(title="Test")
-        with pytest.raises(AttributeError):
-            doc.title = "Modified"  # type: ignore[misc]
-
 
 class TestClassificationCode:
     """Tests for ClassificationCode class."""
@@ -508,12 +502,6 @@ class TestClassificationCode:
         assert code.code_value == "6109.10"
         assert code.description is None
 
-    def test_classification_code_immutable(self):
-        """Test classification code is immutable."""
-        code = ClassificationCode(code_set="HS", code_value="1234")
-        with pytest.raises(AttributeError):
-            code.code_value = "5678"  # type: ignore[misc]
-
 
 class TestDigitalInstruction:
     """Tests for DigitalInstruction class."""
@@ -567,12 +555,6 @@ class TestEUDPPProduct:
         assert product.unique_product_id is None
         assert product.gtin is None
 
-    def test_product_immutable(self):
-        """Test product is immutable."""
-        product = EUDPPProduct(product_name="Test")
-        with pytest.raises(AttributeError):
-            product.product_name = "Modified"  # type: ignore[misc]
-
 
 class TestEUDPP_DPP:
     """Tests for EUDPP_DPP class."""
@@ -609,11 +591,22 @@ class TestEUDPP_DPP:
         assert dpp.link_to_previous_dpp == "https://example.com/dpp/v1"
         assert dpp.last_update == "2024-06-01T12:00:00Z"
 
-    def test_dpp_immutable(self):
-        """Test DPP is immutable."""
-        dpp = EUDPP_DPP(unique_dpp_id="https://example.com/dpp/test")
-        with pytest.raises(AttributeError):
-            dpp.status = "Archived"  # type: ignore[misc]
+
+@pytest.mark.parametrize(
+    ("factory", "attr", "value"),
+    [
+        (lambda: Document(title="Test"), "title", "Modified"),
+        (lambda: ClassificationCode(code_set="HS", code_value="1234"), "code_value", "5678"),
+        (lambda: EUDPPProduct(product_name="Test"), "product_name", "Modified"),
+        (lambda: EUDPP_DPP(unique_dpp_id="https://example.com/dpp/test"), "status", "Archived"),
+    ],
+    ids=["document", "classification_code", "product", "dpp"],
+)
+def test_phase1_class_immutable(factory, attr, value):
+    """Test Phase 1 entity classes are immutable (frozen)."""
+    obj = factory()
+    with pytest.raises(AttributeError):
+        setattr(obj, attr, value)
 
 
 class TestPhase1ClassHierarchy:
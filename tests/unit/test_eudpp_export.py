@@ -1,11 +1,41 @@
 """Tests for EU DPP JSON-LD export (Phase 9)."""
 
-import json
+from dataclasses import dataclass
 
 import pytest
 
+try:
+    from orjson import loads as _jloads
+except ImportError:  # pragma: no cover - optional speedup for local runs
+    from json import loads as _jloads
+
+from dppvalidator.exporters import (
+    EUDPP_CONTEXT_URL as PKG_EUDPP_CONTEXT_URL,
+)
+from dppvalidator.exporters import (
+    EUDPPJsonLDExporter as PkgEUDPPJsonLDExporter,
+)
+from dppvalidator.exporters import (
+    EUDPPTermMapper as PkgEUDPPTermMapper,
+)
+from dppvalidator.exporters import (
+    export_eudpp_jsonld as pkg_export_eudpp_jsonld,
+)
+from dppvalidator.exporters import (
+    export_eudpp_jsonld_dict as pkg_export_eudpp_jsonld_dict,
+)
+from dppvalidator.exporters import (
+    get_eudpp_jsonld_context as pkg_get_eudpp_jsonld_context,
+)
+from dppvalidator.exporters import (
+    get_term_mapping_summary as pkg_get_term_mapping_summary,
+)
+from dppvalidator.exporters import (
+    validate_eudpp_export as pkg_validate_eudpp_export,
+)
 from dppvalidator.exporters.eudpp_jsonld import (
     EUDPP_CONTEXT_URL,
+    SCHEMA_VERSION_STRING,
     EUDPPJsonLDExporter,
     EUDPPTermMapper,
     export_eudpp_jsonld,
@@ -16,6 +46,87 @@ from dppvalidator.exporters.eudpp_jsonld import (
 )
 from dppvalidator.vocabularies.ontology import EUDPPNamespace
 
+# Enum values bound once; these are referenced throughout the module.
+_VC2 = EUDPPNamespace.VC2.value
+_EUDPP_NS = EUDPPNamespace.EUDPP.value
+
+# Pre-built model_dump payloads shared by the mock passports below. The
+# exporter deep-copies its input before transforming it, so the mocks can
+# safely return the same dict on every call.
+_CONTEXT_URL_LOWER = EUDPP_CONTEXT_URL.lower()
+
+# Well-formed validate_eudpp_export input; negative cases derive copies
+# instead of rebuilding the context list from the enum per test.
+_VALID_EXPORT_DATA = {
+    "@context": [
+        _VC2,
+        {"eudpp": _EUDPP_NS},
+    ],
+    "type": ["eudpp:DPP"],
+}
+
+_MOCK_DUMP = {
+    "id": "urn:uuid:12345",
+    "type": ["DigitalProductPassport"],
+    "issuer": {"id": "did:example:issuer"},
+    "validFrom": "2025-01-01T00:00:00Z",
+    "credentialSubject": {
+        "product": {
+            "id": "urn:gtin:1234567890123",
+            "name": "Test Product",
+            "description": "A test product",
+        }
+    },
+}
+
+_MOCK_DUMP_MINIMAL = {
+    "id": "urn:uuid:test",
+    "type": ["DigitalProductPassport"],
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _MockCredentialSubject:
+    granularity_level: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class _MockPassport:
+    credential_subject: _MockCredentialSubject
+    dump: dict
+
+    def model_dump(self, **_kwargs):  # noqa: ARG002
+        return self.dump
+
+
+_MOCK_PASSPORT = _MockPassport(_MockCredentialSubject("model"), _MOCK_DUMP)
+_MOCK_PASSPORT_MINIMAL = _MockPassport(_MockCredentialSubject(None), _MOCK_DUMP_MINIMAL)
+
+
+def _index_context(context: list) -> tuple[set, dict]:
+    """Flatten an @context list into string entries and merged namespace maps."""
+    strings = {c for c in context if isinstance(c, str)}
+    namespaces = {k: v for c in context if isinstance(c, dict) for k, v in c.items()}
+    return strings, namespaces
+
+
+@pytest.fixture(scope="module")
+def eudpp_context():
+    """Result of get_eudpp_jsonld_context(), computed once per module."""
+    return get_eudpp_jsonld_context()
+
+
+@pytest.fixture(scope="module")
+def exported_dict():
+    """Export of the standard mock passport with the default exporter."""
+    return EUDPPJsonLDExporter().export_dict(_MOCK_PASSPORT)
+
+
+@pytest.fixture(scope="module")
+def context_index(exported_dict):
+    """String entries and merged namespace mappings of the exported @context."""
+    return _index_context(exported_dict["@context"])
+
 
 class TestEUDPPTermMapper:
     """Tests for EUDPPTermMapper class."""
@@ -100,23 +211,19 @@ class TestEUDPPJsonLDExporter:
 class TestGetEUDPPJsonLDContext:
     """Tests for get_eudpp_jsonld_context function."""
 
-    def test_returns_list(self):
+    def test_returns_list(self, eudpp_context):
         """Test function returns a list."""
-        context = get_eudpp_jsonld_context()
-        assert isinstance(context, list)
+        assert isinstance(eudpp_context, list)
 
-    def test_contains_vc2_context(self):
+    def test_contains_vc2_context(self, eudpp_context):
         """Test context contains W3C VC2."""
-        context = get_eudpp_jsonld_context()
-        assert EUDPPNamespace.VC2.value in context
+        assert _VC2 in eudpp_context
 
-    def test_contains_eudpp_namespace(self):
+    def test_contains_eudpp_namespace(self, eudpp_context):
         """Test context contains EU DPP namespace."""
-        context = get_eudpp_jsonld_context()
-
         # Should have a dict with eudpp key
-        has_eudpp = any(isinstance(c, dict) and "eudpp" in c for c in context)
-        assert has_eudpp
+        _, namespaces = _index_context(eudpp_context)
+        assert "eudpp" in namespaces
 
 
 class TestValidateEUDPPExport:
@@ -124,52 +231,33 @@ class TestValidateEUDPPExport:
 
     def test_valid_export(self):
         """Test validation of valid export."""
-        data = {
-            "@context": [
-                EUDPPNamespace.VC2.value,
-                {"eudpp": EUDPPNamespace.EUDPP.value},
-            ],
-            "type": ["eudpp:DPP"],
-        }
-
-        issues = validate_eudpp_export(data)
+        issues = validate_eudpp_export(_VALID_EXPORT_DATA)
         assert issues == []
 
     def test_missing_context(self):
         """Test validation detects missing @context."""
-        data = {"type": ["eudpp:DPP"]}
+        data = {k: v for k, v in _VALID_EXPORT_DATA.items() if k != "@context"}
 
         issues = validate_eudpp_export(data)
         assert "Missing @context" in issues
 
     def test_missing_type(self):
         """Test validation detects missing type."""
-        data = {
-            "@context": [
-                EUDPPNamespace.VC2.value,
-                {"eudpp": EUDPPNamespace.EUDPP.value},
-            ],
-        }
+        data = {k: v for k, v in _VALID_EXPORT_DATA.items() if k != "type"}
 
         issues = validate_eudpp_export(data)
         assert "Missing type" in issues
 
     def test_missing_vc2_context(self):
         """Test validation detects missing VC2 context."""
-        data = {
-            "@context": [{"eudpp": EUDPPNamespace.EUDPP.value}],
-            "type": ["eudpp:DPP"],
-        }
+        data = {**_VALID_EXPORT_DATA, "@context": _VALID_EXPORT_DATA["@context"][1:]}
 
         issues = validate_eudpp_export(data)
         assert "Missing W3C VC2 context" in issues
 
     def test_missing_eudpp_namespace(self):
         """Test validation detects missing EU DPP namespace."""
-        data = {
-            "@context": [EUDPPNamespace.VC2.value],
-            "type": ["eudpp:DPP"],
-        }
+        data = {**_VALID_EXPORT_DATA, "@context": _VALID_EXPORT_DATA["@context"][:1]}
 
         issues = validate_eudpp_export(data)
         assert "Missing EU DPP namespace in context" in issues
@@ -198,26 +286,15 @@ class TestEUDPPExporterImports:
     """Tests for EU DPP exporter imports from package."""
 
     def test_import_from_exporters_package(self):
-        """Test importing from exporters package."""
-        from dppvalidator.exporters import (
-            EUDPP_CONTEXT_URL,
-            EUDPPJsonLDExporter,
-            EUDPPTermMapper,
-            export_eudpp_jsonld,
-            export_eudpp_jsonld_dict,
-            get_eudpp_jsonld_context,
-            get_term_mapping_summary,
-            validate_eudpp_export,
-        )
-
-        assert EUDPPJsonLDExporter is not None
-        assert EUDPPTermMapper is not None
-        assert EUDPP_CONTEXT_URL is not None
-        assert export_eudpp_jsonld is not None
-        assert export_eudpp_jsonld_dict is not None
-        assert get_eudpp_jsonld_context is not None
-        assert get_term_mapping_summary is not None
-        assert validate_eudpp_export is not None
+        """Test the exporters package re-exports the eudpp_jsonld symbols."""
+        assert PkgEUDPPJsonLDExporter is EUDPPJsonLDExporter
+        assert PkgEUDPPTermMapper is EUDPPTermMapper
+        assert PKG_EUDPP_CONTEXT_URL is EUDPP_CONTEXT_URL
+        assert pkg_export_eudpp_jsonld is export_eudpp_jsonld
+        assert pkg_export_eudpp_jsonld_dict is export_eudpp_jsonld_dict
+        assert pkg_get_eudpp_jsonld_context is get_eudpp_jsonld_context
+        assert pkg_get_term_mapping_summary is get_term_mapping_summary
+        assert pkg_validate_eudpp_export is validate_eudpp_export
 
 
 class TestEUDPPContextURL:
@@ -227,7 +304,7 @@ class TestEUDPPContextURL:
         """Test context URL is defined."""
         assert EUDPP_CONTEXT_URL is not None
         assert isinstance(EUDPP_CONTEXT_URL, str)
-        assert "dpp" in EUDPP_CONTEXT_URL.lower()
+        assert "dpp" in _CONTEXT_URL_LOWER
 
 
 class TestExporterWithMockPassport:
@@ -235,30 +312,8 @@ class TestExporterWithMockPassport:
 
     @pytest.fixture
     def mock_passport(self):
-        """Create a mock passport-like object for testing."""
-
-        class MockCredentialSubject:
-            granularity_level = "model"
-
-        class MockPassport:
-            credential_subject = MockCredentialSubject()
-
-            def model_dump(self, **_kwargs):  # noqa: ARG002
-                return {
-                    "id": "urn:uuid:12345",
-                    "type": ["DigitalProductPassport"],
-                    "issuer": {"id": "did:example:issuer"},
-                    "validFrom": "2025-01-01T00:00:00Z",
-                    "credentialSubject": {
-                        "product": {
-                            "id": "urn:gtin:1234567890123",
-                            "name": "Test Product",
-                            "description": "A test product",
-                        }
-                    },
-                }
-
-        return MockPassport()
+        """Return the shared mock passport instance."""
+        return _MOCK_PASSPORT
 
     def test_export_dict(self, mock_passport):
         """Test exporting passport to dictionary."""
@@ -276,24 +331,18 @@ class TestExporterWithMockPassport:
         assert isinstance(result, str)
 
         # Should be valid JSON
-        parsed = json.loads(result)
+        parsed = _jloads(result)
         assert "@context" in parsed
 
-    def test_export_contains_vc2_context(self, mock_passport):
+    def test_export_contains_vc2_context(self, context_index):
         """Test export contains W3C VC2 context."""
-        exporter = EUDPPJsonLDExporter()
-        result = exporter.export_dict(mock_passport)
-
-        assert EUDPPNamespace.VC2.value in result["@context"]
+        strings, _ = context_index
+        assert _VC2 in strings
 
-    def test_export_contains_eudpp_namespace(self, mock_passport):
+    def test_export_contains_eudpp_namespace(self, context_index):
         """Test export contains EU DPP namespace."""
-        exporter = EUDPPJsonLDExporter()
-        result = exporter.export_dict(mock_passport)
-
-        # Context should contain eudpp namespace
-        has_eudpp = any(isinstance(c, dict) and "eudpp" in c for c in result["@context"])
-        assert has_eudpp
+        _, namespaces = context_index
+        assert "eudpp" in namespaces
 
     def test_export_with_term_mapping(self, mock_passport):
         """Test export applies term mapping."""
@@ -317,8 +366,8 @@ class TestExporterWithMockPassport:
         result = exporter.export_dict(mock_passport)
 
         # Should have UNTP namespace in context
-        has_untp = any(isinstance(c, dict) and "untp" in c for c in result["@context"])
-        assert has_untp
+        _, namespaces = _index_context(result["@context"])
+        assert "untp" in namespaces
 
     def test_export_adds_schema_version(self, mock_passport):
         """Test export adds schema version."""
@@ -326,7 +375,7 @@ class TestExporterWithMockPassport:
         result = exporter.export_dict(mock_passport)
 
         assert "schemaVersion" in result
-        assert "CIRPASS" in result["schemaVersion"]
+        assert result["schemaVersion"] == SCHEMA_VERSION_STRING
 
     def test_export_adds_granularity(self, mock_passport):
         """Test export adds granularity from credential subject."""
@@ -340,47 +389,35 @@ class TestExporterWithMockPassport:
 class TestConvenienceFunctions:
     """Tests for convenience export functions."""
 
-    @pytest.fixture
-    def mock_passport(self):
-        """Create a mock passport for testing."""
-
-        class MockCredentialSubject:
-            granularity_level = None
-
-        class MockPassport:
-            credential_subject = MockCredentialSubject()
-
-            def model_dump(self, **_kwargs):  # noqa: ARG002
-                return {
-                    "id": "urn:uuid:test",
-                    "type": ["DigitalProductPassport"],
-                }
-
-        return MockPassport()
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def exported_variants():
+        """Run each convenience export once and share the results."""
+        return {
+            "str": export_eudpp_jsonld(_MOCK_PASSPORT_MINIMAL),
+            "dict_map": export_eudpp_jsonld_dict(_MOCK_PASSPORT_MINIMAL, map_terms=True),
+            "dict_nomap": export_eudpp_jsonld_dict(_MOCK_PASSPORT_MINIMAL, map_terms=False),
+        }
 
-    def test_export_eudpp_jsonld(self, mock_passport):
+    def test_export_eudpp_jsonld(self, exported_variants):
         """Test export_eudpp_jsonld convenience function."""
-        result = export_eudpp_jsonld(mock_passport)
+        result = exported_variants["str"]
 
         assert isinstance(result, str)
-        parsed = json.loads(result)
+        parsed = _jloads(result)
         assert "@context" in parsed
 
-    def test_export_eudpp_jsonld_dict(self, mock_passport):
+    def test_export_eudpp_jsonld_dict(self, exported_variants):
         """Test export_eudpp_jsonld_dict convenience function."""
-        result = export_eudpp_jsonld_dict(mock_passport)
+        result = exported_variants["dict_map"]
 
         assert isinstance(result, dict)
         assert "@context" in result
 
-    def test_export_eudpp_jsonld_no_mapping(self, mock_passport):
+    def test_export_eudpp_jsonld_no_mapping(self, exported_variants):
         """Test convenience function with no term mapping."""
-        result = export_eudpp_jsonld_dict(mock_passport, map_terms=False)
-
-        assert "id" in result
+        assert "id" in exported_variants["dict_nomap"]
 
-    def test_export_eudpp_jsonld_with_mapping(self, mock_passport):
+    def test_export_eudpp_jsonld_with_mapping(self, exported_variants):
         """Test convenience function with term mapping."""
-        result = export_eudpp_jsonld_dict(mock_passport, map_terms=True)
-
-        assert "uniqueDPPID" in result
+        assert "uniqueDPPID" in exported_variants["dict_map"]
@@ -1,5 +1,6 @@
 """Tests for EU DPP Core Ontology LCA module (Phase 4)."""
 
+from dataclasses import FrozenInstanceError
 from decimal import Decimal
 
 import pytest
@@ -29,6 +30,24 @@ from dppvalidator.vocabularies.eudpp_lca import (
     is_toxicity_related,
 )
 
+# Decimal parsing is comparatively expensive; build the shared values once.
+_D_1_0 = Decimal("1.0")
+_D_12_5 = Decimal("12.5")
+_D_20_0 = Decimal("20.0")
+
+
+@pytest.fixture(scope="module")
+def all_category_results():
+    """One ImpactResult per PEF category, built once for the module."""
+    return tuple(
+        ImpactResult(
+            category=cat.value,
+            value=_D_1_0,
+            unit="unit",
+        )
+        for cat in ImpactCategory
+    )
+
 
 class TestLCANamespace:
     """Tests for LCA namespace constants."""
@@ -56,30 +75,26 @@ class TestImpactCategory:
 
     def test_all_16_pef_categories_exist(self):
         """Test all 16 PEF 3.1 impact categories are defined."""
-        categories = list(ImpactCategory)
-        assert len(categories) == 16
-
-    def test_climate_change_category(self):
-        """Test climate change category."""
-        assert ImpactCategory.CLIMATE_CHANGE.value == "lca:Climate_change_total"
-
-    def test_toxicity_categories(self):
-        """Test toxicity categories."""
-        assert ImpactCategory.HUMAN_TOXICITY_CANCER.value == "lca:Human_toxicity_cancer"
-        assert ImpactCategory.HUMAN_TOXICITY_NON_CANCER.value == "lca:Human_toxicity_non_cancer"
-        assert ImpactCategory.ECOTOXICITY_FRESHWATER.value == "lca:Ecotoxicity_freshwater"
-
-    def test_eutrophication_categories(self):
-        """Test eutrophication categories."""
-        assert ImpactCategory.EUTROPHICATION_FRESHWATER.value == "lca:Eutrophication_freshwater"
-        assert ImpactCategory.EUTROPHICATION_MARINE.value == "lca:Eutrophication_marine"
-        assert ImpactCategory.EUTROPHICATION_TERRESTRIAL.value == "lca:Eutrophication_terrestrial"
-
-    def test_resource_categories(self):
-        """Test resource use categories."""
-        assert ImpactCategory.RESOURCE_FOSSILS.value == "lca:Resource_use_fossils"
-        assert ImpactCategory.RESOURCE_MINERALS.value == "lca:Resource_use_minerals_and_metals"
-        assert ImpactCategory.WATER_USE.value == "lca:Water_use"
+        assert len(ImpactCategory) == 16
+
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (ImpactCategory.CLIMATE_CHANGE, "lca:Climate_change_total"),
+            (ImpactCategory.HUMAN_TOXICITY_CANCER, "lca:Human_toxicity_cancer"),
+            (ImpactCategory.HUMAN_TOXICITY_NON_CANCER, "lca:Human_toxicity_non_cancer"),
+            (ImpactCategory.ECOTOXICITY_FRESHWATER, "lca:Ecotoxicity_freshwater"),
+            (ImpactCategory.EUTROPHICATION_FRESHWATER, "lca:Eutrophication_freshwater"),
+            (ImpactCategory.EUTROPHICATION_MARINE, "lca:Eutrophication_marine"),
+            (ImpactCategory.EUTROPHICATION_TERRESTRIAL, "lca:Eutrophication_terrestrial"),
+            (ImpactCategory.RESOURCE_FOSSILS, "lca:Resource_use_fossils"),
+            (ImpactCategory.RESOURCE_MINERALS, "lca:Resource_use_minerals_and_metals"),
+            (ImpactCategory.WATER_USE, "lca:Water_use"),
+        ],
+    )
+    def test_category_values(self, member, expected):
+        """Test impact category URI values."""
+        assert member.value == expected
 
 
 class TestImpactCategoryIndicator:
@@ -136,20 +151,20 @@ class TestImpactResult:
         """Test creating an impact result."""
         result = ImpactResult(
             category=ImpactCategory.CLIMATE_CHANGE.value,
-            value=Decimal("12.5"),
+            value=_D_12_5,
             unit="kg CO2-eq",
             indicator=ImpactCategoryIndicator.GWP100.value,
             model=CharacterizationModel.IPCC_2021.value,
         )
         assert result.category == "lca:Climate_change_total"
-        assert result.value == Decimal("12.5")
+        assert result.value == _D_12_5
         assert result.unit == "kg CO2-eq"
 
     def test_validate_valid_category(self):
         """Test validate with valid category."""
         result = ImpactResult(
             category=ImpactCategory.CLIMATE_CHANGE.value,
-            value=Decimal("12.5"),
+            value=_D_12_5,
             unit="kg CO2-eq",
         )
         errors = result.validate()
@@ -159,7 +174,7 @@ class TestImpactResult:
         """Test validate with invalid category."""
         result = ImpactResult(
             category="lca:Unknown_category",
-            value=Decimal("12.5"),
+            value=_D_12_5,
             unit="kg CO2-eq",
         )
         errors = result.validate()
@@ -170,11 +185,11 @@ class TestImpactResult:
         """Test impact result is immutable."""
         result = ImpactResult(
             category=ImpactCategory.CLIMATE_CHANGE.value,
-            value=Decimal("12.5"),
+            value=_D_12_5,
             unit="kg CO2-eq",
         )
-        with pytest.raises(AttributeError):
-            result.value = Decimal("20.0")  # type: ignore[misc]
+        with pytest.raises(FrozenInstanceError):
+            result.value = _D_20_0  # type: ignore[misc]
 
 
 class TestCharacterizationFactor:
@@ -184,7 +199,7 @@ class TestCharacterizationFactor:
         """Test creating a characterization factor."""
         cf = CharacterizationFactor(
             name="GWP-100",
-            value=Decimal("1.0"),
+            value=_D_1_0,
             unit="kg CO2-eq/kg",
             model=CharacterizationModel.IPCC_2021.value,
         )
@@ -248,7 +263,7 @@ class TestProductEnvironmentalFootprint:
         """Test get_impact when category exists."""
         result = ImpactResult(
             category=ImpactCategory.CLIMATE_CHANGE.value,
-            value=Decimal("12.5"),
+            value=_D_12_5,
             unit="kg CO2-eq",
         )
         pef = ProductEnvironmentalFootprint(
@@ -257,7 +272,7 @@ class TestProductEnvironmentalFootprint:
         )
         found = pef.get_impact(ImpactCategory.CLIMATE_CHANGE)
         assert found is not None
-        assert found.value == Decimal("12.5")
+        assert found.value == _D_12_5
 
     def test_get_impact_not_found(self):
         """Test get_impact when category doesn't exist."""
@@ -270,19 +285,11 @@ class TestProductEnvironmentalFootprint:
         pef = ProductEnvironmentalFootprint(product_name="Test")
         assert not pef.has_all_categories()
 
-    def test_has_all_categories_true(self):
+    def test_has_all_categories_true(self, all_category_results):
         """Test has_all_categories returns True when complete."""
-        results = tuple(
-            ImpactResult(
-                category=cat.value,
-                value=Decimal("1.0"),
-                unit="unit",
-            )
-            for cat in ImpactCategory
-        )
         pef = ProductEnvironmentalFootprint(
             product_name="Test",
-            impact_results=results,
+            impact_results=all_category_results,
         )
         assert pef.has_all_categories()
 
@@ -290,7 +297,7 @@ class TestProductEnvironmentalFootprint:
         """Test missing_categories returns correct list."""
         result = ImpactResult(
             category=ImpactCategory.CLIMATE_CHANGE.value,
-            value=Decimal("12.5"),
+            value=_D_12_5,
             unit="kg CO2-eq",
         )
         pef = ProductEnvironmentalFootprint(
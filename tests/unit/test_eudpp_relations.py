@@ -17,80 +17,68 @@ from dppvalidator.vocabularies.eudpp_relations import (
 )
 
 
+@pytest.fixture(scope="session")
+def mapper() -> ProductRelationMapper:
+    """Create one mapper for the whole session; it is immutable."""
+    return ProductRelationMapper()
+
+
 class TestEUDPPObjectProperty:
     """Tests for EUDPPObjectProperty enum."""
 
-    def test_dpp_product_relations_exist(self):
-        """Test DPP-Product relation URIs exist."""
-        assert EUDPPObjectProperty.HAS_DPP.value == "eudpp:hasDPP"
-        assert EUDPPObjectProperty.APPLIES_TO_PRODUCT.value == "eudpp:appliesToProduct"
-
-    def test_product_hierarchy_relations_exist(self):
-        """Test product hierarchy relation URIs exist."""
-        assert EUDPPObjectProperty.IS_COMPONENT_OF.value == "eudpp:isComponentOf"
-        assert EUDPPObjectProperty.IS_SPARE_PART_OF.value == "eudpp:isSparePartOf"
-
-    def test_actor_relations_exist(self):
-        """Test actor relation URIs exist."""
-        assert EUDPPObjectProperty.HAS_ISSUER.value == "eudpp:hasIssuer"
-        assert EUDPPObjectProperty.HAS_MANUFACTURER.value == "eudpp:hasManufacturer"
-        assert EUDPPObjectProperty.HAS_ECONOMIC_OPERATOR.value == "eudpp:hasEconomicOperator"
-        assert EUDPPObjectProperty.HAS_BACKUP_COPY_HOST.value == "eudpp:hasBackUpCopyHost"
-
-    def test_classification_relations_exist(self):
-        """Test classification relation URIs exist."""
-        assert EUDPPObjectProperty.HAS_PRODUCT_GROUP.value == "eudpp:hasProductGroup"
-
-    def test_property_relations_exist(self):
-        """Test property relation URIs exist."""
-        assert EUDPPObjectProperty.HAS_PROPERTY.value == "eudpp:hasProperty"
-        assert EUDPPObjectProperty.HAS_MEASUREMENT_UNIT.value == "eudpp:hasMeasurementUnit"
-
-    def test_substance_relations_exist(self):
-        """Test substance relation URIs exist."""
-        assert (
-            EUDPPObjectProperty.CONTAINS_SUBSTANCE_OF_CONCERN.value
-            == "eudpp:containsSubstanceOfConcern"
-        )
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (EUDPPObjectProperty.HAS_DPP, "eudpp:hasDPP"),
+            (EUDPPObjectProperty.APPLIES_TO_PRODUCT, "eudpp:appliesToProduct"),
+            (EUDPPObjectProperty.IS_COMPONENT_OF, "eudpp:isComponentOf"),
+            (EUDPPObjectProperty.IS_SPARE_PART_OF, "eudpp:isSparePartOf"),
+            (EUDPPObjectProperty.HAS_ISSUER, "eudpp:hasIssuer"),
+            (EUDPPObjectProperty.HAS_MANUFACTURER, "eudpp:hasManufacturer"),
+            (EUDPPObjectProperty.HAS_ECONOMIC_OPERATOR, "eudpp:hasEconomicOperator"),
+            (EUDPPObjectProperty.HAS_BACKUP_COPY_HOST, "eudpp:hasBackUpCopyHost"),
+            (EUDPPObjectProperty.HAS_PRODUCT_GROUP, "eudpp:hasProductGroup"),
+            (EUDPPObjectProperty.HAS_PROPERTY, "eudpp:hasProperty"),
+            (EUDPPObjectProperty.HAS_MEASUREMENT_UNIT, "eudpp:hasMeasurementUnit"),
+            (
+                EUDPPObjectProperty.CONTAINS_SUBSTANCE_OF_CONCERN,
+                "eudpp:containsSubstanceOfConcern",
+            ),
+        ],
+    )
+    def test_object_property_values(self, member, expected):
+        """Test object property URI values."""
+        assert member.value == expected
 
 
 class TestEUDPPDatatypeProperty:
     """Tests for EUDPPDatatypeProperty enum."""
 
-    def test_identification_properties_exist(self):
-        """Test identification property URIs exist."""
-        assert EUDPPDatatypeProperty.UNIQUE_DPP_ID.value == "eudpp:uniqueDPPID"
-        assert EUDPPDatatypeProperty.UNIQUE_PRODUCT_ID.value == "eudpp:uniqueProductID"
-        assert EUDPPDatatypeProperty.GTIN.value == "eudpp:GTIN"
-        assert EUDPPDatatypeProperty.COMMODITY_CODE.value == "eudpp:commodityCode"
-
-    def test_product_info_properties_exist(self):
-        """Test product info property URIs exist."""
-        assert EUDPPDatatypeProperty.PRODUCT_NAME.value == "eudpp:productName"
-        assert EUDPPDatatypeProperty.DESCRIPTION.value == "eudpp:description"
-        assert EUDPPDatatypeProperty.PRODUCT_IMAGE.value == "eudpp:productImage"
-
-    def test_lifecycle_properties_exist(self):
-        """Test lifecycle property URIs exist."""
-        assert EUDPPDatatypeProperty.VALID_FROM.value == "eudpp:validFrom"
-        assert EUDPPDatatypeProperty.VALID_UNTIL.value == "eudpp:validUntil"
-        assert EUDPPDatatypeProperty.LAST_UPDATE.value == "eudpp:lastUpdate"
-        assert EUDPPDatatypeProperty.STATUS.value == "eudpp:status"
-        assert EUDPPDatatypeProperty.SCHEMA_VERSION.value == "eudpp:schemaVersion"
-        assert EUDPPDatatypeProperty.LINK_TO_PREVIOUS_DPP.value == "eudpp:linkToPreviousDPP"
-
-    def test_granularity_property_exists(self):
-        """Test granularity property URI exists."""
-        assert EUDPPDatatypeProperty.GRANULARITY.value == "eudpp:granularity"
-
-    def test_energy_related_property_exists(self):
-        """Test energy-related property URI exists."""
-        assert EUDPPDatatypeProperty.IS_ENERGY_RELATED.value == "eudpp:isEnergyRelated"
-
-    def test_quantitative_properties_exist(self):
-        """Test quantitative property URIs exist."""
-        assert EUDPPDatatypeProperty.NUMERICAL_VALUE.value == "eudpp:numericalValue"
-        assert EUDPPDatatypeProperty.TOLERANCE.value == "eudpp:tolerance"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (EUDPPDatatypeProperty.UNIQUE_DPP_ID, "eudpp:uniqueDPPID"),
+            (EUDPPDatatypeProperty.UNIQUE_PRODUCT_ID, "eudpp:uniqueProductID"),
+            (EUDPPDatatypeProperty.GTIN, "eudpp:GTIN"),
+            (EUDPPDatatypeProperty.COMMODITY_CODE, "eudpp:commodityCode"),
+            (EUDPPDatatypeProperty.PRODUCT_NAME, "eudpp:productName"),
+            (EUDPPDatatypeProperty.DESCRIPTION, "eudpp:description"),
+            (EUDPPDatatypeProperty.PRODUCT_IMAGE, "eudpp:productImage"),
+            (EUDPPDatatypeProperty.VALID_FROM, "eudpp:validFrom"),
+            (EUDPPDatatypeProperty.VALID_UNTIL, "eudpp:validUntil"),
+            (EUDPPDatatypeProperty.LAST_UPDATE, "eudpp:lastUpdate"),
+            (EUDPPDatatypeProperty.STATUS, "eudpp:status"),
+            (EUDPPDatatypeProperty.SCHEMA_VERSION, "eudpp:schemaVersion"),
+            (EUDPPDatatypeProperty.LINK_TO_PREVIOUS_DPP, "eudpp:linkToPreviousDPP"),
+            (EUDPPDatatypeProperty.GRANULARITY, "eudpp:granularity"),
+            (EUDPPDatatypeProperty.IS_ENERGY_RELATED, "eudpp:isEnergyRelated"),
+            (EUDPPDatatypeProperty.NUMERICAL_VALUE, "eudpp:numericalValue"),
+            (EUDPPDatatypeProperty.TOLERANCE, "eudpp:tolerance"),
+        ],
+    )
+    def test_datatype_property_values(self, member, expected):
+        """Test datatype property URI values."""
+        assert member.value == expected
 
 
 class TestObjectPropertyDefinition:
@@ -169,22 +157,19 @@ class TestPropertyCollections:
         """Test DATATYPE_PROPERTIES is not empty."""
         assert len(DATATYPE_PROPERTIES) >= 15
 
-    def test_all_object_properties_have_uri(self):
-        """Test all object properties have URI."""
-        for prop in OBJECT_PROPERTIES:
-            assert prop.uri.startswith("eudpp:")
+    @pytest.mark.parametrize("prop", OBJECT_PROPERTIES, ids=lambda p: p.uri)
+    def test_object_property_has_uri(self, prop: ObjectPropertyDefinition):
+        """Test each object property has an eudpp-prefixed URI."""
+        assert prop.uri.startswith("eudpp:")
 
-    def test_all_datatype_properties_have_uri(self):
-        """Test all datatype properties have URI."""
-        for prop in DATATYPE_PROPERTIES:
-            assert prop.uri.startswith("eudpp:")
+    @pytest.mark.parametrize("prop", DATATYPE_PROPERTIES, ids=lambda p: p.uri)
+    def test_datatype_property_has_uri(self, prop: DatatypePropertyDefinition):
+        """Test each datatype property has an eudpp-prefixed URI."""
+        assert prop.uri.startswith("eudpp:")
 
-    def test_is_component_of_is_transitive(self):
+    def test_is_component_of_is_transitive(self, mapper: ProductRelationMapper):
         """Test isComponentOf is marked as transitive."""
-        component_prop = next(
-            (p for p in OBJECT_PROPERTIES if p.uri == "eudpp:isComponentOf"),
-            None,
-        )
+        component_prop = mapper.get_object_property("eudpp:isComponentOf")
         assert component_prop is not None
         assert component_prop.is_transitive is True
 
@@ -192,11 +177,6 @@ class TestPropertyCollections:
 class TestProductRelationMapper:
     """Tests for ProductRelationMapper class."""
 
-    @pytest.fixture
-    def mapper(self) -> ProductRelationMapper:
-        """Create mapper instance."""
-        return ProductRelationMapper()
-
     def test_get_object_property(self, mapper: ProductRelationMapper):
         """Test getting object property by URI."""
         prop = mapper.get_object_property("eudpp:isComponentOf")
@@ -24,108 +24,161 @@ from dppvalidator.vocabularies.eudpp_substances import (
     validate_cas_checksum,
 )
 
+# Shared Decimal constants; Decimal is immutable, so reuse across tests is
+# safe and skips repeated string parsing.
+_D_0_05 = Decimal("0.05")
+_D_0_1 = Decimal("0.1")
+_D_0_15 = Decimal("0.15")
+_D_0_2 = Decimal("0.2")
+_D_NEG_0_1 = Decimal("-0.1")
+_D_1500 = Decimal("1500")
+
+# Bound match methods: skips the attribute lookup on the compiled pattern in
+# the per-case hot path once the input tables grow.
+_CAS_MATCH = CAS_NUMBER_PATTERN.match
+_EC_MATCH = EC_NUMBER_PATTERN.match
+
 
 class TestEUDPPSubstanceClass:
     """Tests for EUDPPSubstanceClass enum."""
 
-    def test_substance_classes_exist(self):
-        """Test substance class URIs exist."""
-        assert EUDPPSubstanceClass.SUBSTANCE.value == "eudpp:Substance"
-        assert EUDPPSubstanceClass.SUBSTANCE_OF_CONCERN.value == "eudpp:SubstanceOfConcern"
-        assert EUDPPSubstanceClass.CONCENTRATION.value == "eudpp:Concentration"
-        assert EUDPPSubstanceClass.THRESHOLD.value == "eudpp:Threshold"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (EUDPPSubstanceClass.SUBSTANCE, "eudpp:Substance"),
+            (EUDPPSubstanceClass.SUBSTANCE_OF_CONCERN, "eudpp:SubstanceOfConcern"),
+            (EUDPPSubstanceClass.CONCENTRATION, "eudpp:Concentration"),
+            (EUDPPSubstanceClass.THRESHOLD, "eudpp:Threshold"),
+        ],
+    )
+    def test_substance_class_value(self, member, expected):
+        """Test substance class URI values."""
+        assert member.value == expected
 
 
 class TestLifeCycleStage:
     """Tests for LifeCycleStage enum."""
 
-    def test_lifecycle_stages_exist(self):
-        """Test lifecycle stage values exist."""
-        assert LifeCycleStage.PRODUCTION.value == "production"
-        assert LifeCycleStage.IN_PRODUCT.value == "in_product"
-        assert LifeCycleStage.USE.value == "use"
-        assert LifeCycleStage.END_OF_LIFE.value == "end_of_life"
-        assert LifeCycleStage.WASTE.value == "waste"
-        assert LifeCycleStage.RECYCLING.value == "recycling"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (LifeCycleStage.PRODUCTION, "production"),
+            (LifeCycleStage.IN_PRODUCT, "in_product"),
+            (LifeCycleStage.USE, "use"),
+            (LifeCycleStage.END_OF_LIFE, "end_of_life"),
+            (LifeCycleStage.WASTE, "waste"),
+            (LifeCycleStage.RECYCLING, "recycling"),
+        ],
+    )
+    def test_lifecycle_stage_value(self, member, expected):
+        """Test lifecycle stage values."""
+        assert member.value == expected
 
 
 class TestHazardCategory:
     """Tests for HazardCategory enum."""
 
-    def test_carcinogenicity_categories(self):
-        """Test carcinogenicity hazard categories."""
-        assert HazardCategory.CARCINOGENICITY_1.value == "carcinogenicity_cat_1"
-        assert HazardCategory.CARCINOGENICITY_2.value == "carcinogenicity_cat_2"
-
-    def test_mutagenicity_categories(self):
-        """Test mutagenicity hazard categories."""
-        assert HazardCategory.MUTAGENICITY_1.value == "mutagenicity_cat_1"
-        assert HazardCategory.MUTAGENICITY_2.value == "mutagenicity_cat_2"
-
-    def test_svhc_and_pop(self):
-        """Test SVHC and POP categories."""
-        assert HazardCategory.SVHC.value == "svhc_reach_art_57"
-        assert HazardCategory.POP.value == "persistent_organic_pollutant"
+    @pytest.mark.parametrize(
+        ("member", "expected"),
+        [
+            (HazardCategory.CARCINOGENICITY_1, "carcinogenicity_cat_1"),
+            (HazardCategory.CARCINOGENICITY_2, "carcinogenicity_cat_2"),
+            (HazardCategory.MUTAGENICITY_1, "mutagenicity_cat_1"),
+            (HazardCategory.MUTAGENICITY_2, "mutagenicity_cat_2"),
+            (HazardCategory.SVHC, "svhc_reach_art_57"),
+            (HazardCategory.POP, "persistent_organic_pollutant"),
+        ],
+    )
+    def test_hazard_category_value(self, member, expected):
+        """Test hazard category values."""
+        assert member.value == expected
 
 
 class TestCASNumberValidation:
     """Tests for CAS number validation."""
 
-    def test_valid_cas_numbers(self):
+    @pytest.mark.parametrize(
+        "cas",
+        [
+            "50-00-0",  # Formaldehyde
+            "7440-23-5",  # Sodium
+            "15829-53-5",  # Mercurous Oxide
+            "1234567-89-0",  # Max digits
+        ],
+    )
+    def test_valid_cas_numbers(self, cas: str):
         """Test valid CAS number formats."""
-        assert is_valid_cas_number("50-00-0")  # Formaldehyde
-        assert is_valid_cas_number("7440-23-5")  # Sodium
-        assert is_valid_cas_number("15829-53-5")  # Mercurous Oxide
-        assert is_valid_cas_number("1234567-89-0")  # Max digits
-
-    def test_invalid_cas_numbers(self):
+        assert is_valid_cas_number(cas)
+
+    @pytest.mark.parametrize(
+        "cas",
+        [
+            "invalid",
+            "50-00",  # Missing check digit
+            "5-00-0",  # Too few leading digits
+            "50-0-0",  # Wrong middle format
+            "50-00-00",  # Too many check digits
+        ],
+    )
+    def test_invalid_cas_numbers(self, cas: str):
         """Test invalid CAS number formats."""
-        assert not is_valid_cas_number("invalid")
-        assert not is_valid_cas_number("50-00")  # Missing check digit
-        assert not is_valid_cas_number("5-00-0")  # Too few leading digits
-        assert not is_valid_cas_number("50-0-0")  # Wrong middle format
-        assert not is_valid_cas_number("50-00-00")  # Too many check digits
+        assert not is_valid_cas_number(cas)
 
     def test_cas_pattern(self):
         """Test CAS_NUMBER_PATTERN regex."""
-        assert CAS_NUMBER_PATTERN.match("50-00-0")
-        assert not CAS_NUMBER_PATTERN.match("invalid")
+        assert _CAS_MATCH("50-00-0")
+        assert not _CAS_MATCH("invalid")
 
 
 class TestECNumberValidation:
     """Tests for EC number validation."""
 
-    def test_valid_ec_numbers(self):
+    @pytest.mark.parametrize(
+        "ec",
+        [
+            "200-001-8",  # Formaldehyde
+            "231-132-9",  # Sodium
+            "239-934-0",  # Mercurous Oxide
+        ],
+    )
+    def test_valid_ec_numbers(self, ec: str):
         """Test valid EC number formats."""
-        assert is_valid_ec_number("200-001-8")  # Formaldehyde
-        assert is_valid_ec_number("231-132-9")  # Sodium
-        assert is_valid_ec_number("239-934-0")  # Mercurous Oxide
-
-    def test_invalid_ec_numbers(self):
+        assert is_valid_ec_number(ec)
+
+    @pytest.mark.parametrize(
+        "ec",
+        [
+            "invalid",
+            "20-001-8",  # Too few leading digits
+            "200-01-8",  # Too few middle digits
+            "200-001-88",  # Too many check digits
+        ],
+    )
+    def test_invalid_ec_numbers(self, ec: str):
         """Test invalid EC number formats."""
-        assert not is_valid_ec_number("invalid")
-        assert not is_valid_ec_number("20-001-8")  # Too few leading digits
-        assert not is_valid_ec_number("200-01-8")  # Too few middle digits
-        assert not is_valid_ec_number("200-001-88")  # Too many check digits
+        assert not is_valid_ec_number(ec)
 
     def test_ec_pattern(self):
         """Test EC_NUMBER_PATTERN regex."""
-        assert EC_NUMBER_PATTERN.match("200-001-8")
-        assert not EC_NUMBER_PATTERN.match("invalid")
+        assert _EC_MATCH("200-001-8")
+        assert not _EC_MATCH("invalid")
 
 
 class TestCASChecksumValidation:
     """Tests for CAS checksum validation."""
 
-    def test_valid_checksums(self):
-        """Test valid CAS checksums."""
-        assert validate_cas_checksum("50-00-0")  # Formaldehyde
-        assert validate_cas_checksum("7440-23-5")  # Sodium
-
-    def test_invalid_checksums(self):
-        """Test invalid CAS checksums."""
-        assert not validate_cas_checksum("50-00-1")  # Wrong check digit
-        assert not validate_cas_checksum("invalid")
+    @pytest.mark.parametrize(
+        ("cas", "expected"),
+        [
+            ("50-00-0", True),  # Formaldehyde
+            ("7440-23-5", True),  # Sodium
+            ("50-00-1", False),  # Wrong check digit
+            ("invalid", False),
+        ],
+    )
+    def test_cas_checksum(self, cas: str, expected: bool):
+        """Test CAS checksum validation."""
+        assert validate_cas_checksum(cas) is expected
 
 
 class TestSubstance:
@@ -170,28 +223,22 @@ class TestSubstanceOfConcern:
         assert soc.number_cas == "50-00-0"
         assert soc.number_ec == "200-001-8"
 
-    def test_soc_validate_identifiers_valid(self):
-        """Test validate_identifiers with valid identifiers."""
-        soc = SubstanceOfConcern(
-            number_cas="50-00-0",
-            number_ec="200-001-8",
-        )
-        errors = soc.validate_identifiers()
-        assert len(errors) == 0
-
-    def test_soc_validate_identifiers_invalid_cas(self):
-        """Test validate_identifiers with invalid CAS number."""
-        soc = SubstanceOfConcern(number_cas="invalid")
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_errors"),
+        [
+            ({"number_cas": "50-00-0", "number_ec": "200-001-8"}, ()),
+            ({"number_cas": "invalid"}, ("CAS number",)),
+            ({"number_ec": "invalid"}, ("EC number",)),
+        ],
+        ids=["valid", "invalid_cas", "invalid_ec"],
+    )
+    def test_soc_validate_identifiers(self, kwargs, expected_errors):
+        """Test validate_identifiers for valid and invalid identifiers."""
+        soc = SubstanceOfConcern(**kwargs)
         errors = soc.validate_identifiers()
-        assert len(errors) == 1
-        assert "CAS number" in errors[0]
-
-    def test_soc_validate_identifiers_invalid_ec(self):
-        """Test validate_identifiers with invalid EC number."""
-        soc = SubstanceOfConcern(number_ec="invalid")
-        errors = soc.validate_identifiers()
-        assert len(errors) == 1
-        assert "EC number" in errors[0]
+        assert len(errors) == len(expected_errors)
+        for error, expected in zip(errors, expected_errors, strict=True):
+            assert expected in error
 
     def test_soc_has_valid_identification_true(self):
         """Test has_valid_identification returns True."""
@@ -222,44 +269,44 @@ class TestConcentration:
     def test_create_concentration(self):
         """Test creating a concentration."""
         conc = Concentration(
-            value=Decimal("0.1"),
+            value=_D_0_1,
             unit="%w/w",
         )
         assert conc._class_uri == "eudpp:Concentration"
-        assert conc.value == Decimal("0.1")
+        assert conc.value == _D_0_1
         assert conc.unit == "%w/w"
 
     def test_concentration_range(self):
         """Test concentration with range."""
         conc = Concentration(
-            value=Decimal("0.15"),
+            value=_D_0_15,
             unit="%w/w",
-            range_min=Decimal("0.1"),
-            range_max=Decimal("0.2"),
+            range_min=_D_0_1,
+            range_max=_D_0_2,
         )
         assert conc.is_range()
-        assert conc.range_min == Decimal("0.1")
-        assert conc.range_max == Decimal("0.2")
+        assert conc.range_min == _D_0_1
+        assert conc.range_max == _D_0_2
 
     def test_concentration_not_range(self):
         """Test concentration without range."""
-        conc = Concentration(value=Decimal("0.1"), unit="%w/w")
+        conc = Concentration(value=_D_0_1, unit="%w/w")
         assert not conc.is_range()
 
     def test_concentration_validate_valid(self):
         """Test validate with valid concentration."""
         conc = Concentration(
-            value=Decimal("0.1"),
+            value=_D_0_1,
             unit="%w/w",
-            range_min=Decimal("0.05"),
-            range_max=Decimal("0.15"),
+            range_min=_D_0_05,
+            range_max=_D_0_15,
         )
         errors = conc.validate()
         assert len(errors) == 0
 
     def test_concentration_validate_negative_value(self):
         """Test validate with negative value."""
-        conc = Concentration(value=Decimal("-0.1"), unit="%w/w")
+        conc = Concentration(value=_D_NEG_0_1, unit="%w/w")
         errors = conc.validate()
         assert len(errors) == 1
         assert "negative" in errors[0]
@@ -267,10 +314,10 @@ class TestConcentration:
     def test_concentration_validate_invalid_range(self):
         """Test validate with min > max."""
         conc = Concentration(
-            value=Decimal("0.1"),
+            value=_D_0_1,
             unit="%w/w",
-            range_min=Decimal("0.2"),
-            range_max=Decimal("0.1"),
+            range_min=_D_0_2,
+            range_max=_D_0_1,
         )
         errors = conc.validate()
         assert len(errors) == 1
@@ -278,9 +325,9 @@ class TestConcentration:
 
     def test_concentration_immutable(self):
         """Test concentration is immutable."""
-        conc = Concentration(value=Decimal("0.1"), unit="%w/w")
+        conc = Concentration(value=_D_0_1, unit="%w/w")
         with pytest.raises(AttributeError):
-            conc.value = Decimal("0.2")  # type: ignore[misc]
+            conc.value = _D_0_2  # type: ignore[misc]
 
 
 class TestThreshold:
@@ -289,23 +336,23 @@ class TestThreshold:
     def test_create_threshold(self):
         """Test creating a threshold."""
         threshold = Threshold(
-            value=Decimal("0.1"),
+            value=_D_0_1,
             unit="%w/w",
             regulation_reference="REACH Annex XVII",
         )
         assert threshold._class_uri == "eudpp:Threshold"
-        assert threshold.value == Decimal("0.1")
+        assert threshold.value == _D_0_1
         assert threshold.regulation_reference == "REACH Annex XVII"
 
     def test_threshold_validate_valid(self):
         """Test validate with valid threshold."""
-        threshold = Threshold(value=Decimal("0.1"), unit="%w/w")
+        threshold = Threshold(value=_D_0_1, unit="%w/w")
         errors = threshold.validate()
         assert len(errors) == 0
 
     def test_threshold_validate_negative(self):
         """Test validate with negative threshold."""
-        threshold = Threshold(value=Decimal("-0.1"), unit="%w/w")
+        threshold = Threshold(value=_D_NEG_0_1, unit="%w/w")
         errors = threshold.validate()
         assert len(errors) == 1
         assert "negative" in errors[0]
@@ -317,8 +364,8 @@ class TestConcentrationOfSubstanceOfConcern:
     def test_create_concentration_of_soc(self):
         """Test creating a concentration of SOC."""
         soc = SubstanceOfConcern(name_iupac="Lead", number_cas="7439-92-1")
-        conc = Concentration(value=Decimal("0.15"), unit="%w/w")
-        threshold = Threshold(value=Decimal("0.1"), unit="%w/w")
+        conc = Concentration(value=_D_0_15, unit="%w/w")
+        threshold = Threshold(value=_D_0_1, unit="%w/w")
 
         csoc = ConcentrationOfSubstanceOfConcern(
             substance=soc,
@@ -326,13 +373,13 @@ class TestConcentrationOfSubstanceOfConcern:
             threshold=threshold,
         )
         assert csoc.substance.name_iupac == "Lead"
-        assert csoc.concentration.value == Decimal("0.15")
+        assert csoc.concentration.value == _D_0_15
 
     def test_exceeds_threshold_true(self):
         """Test exceeds_threshold returns True."""
         soc = SubstanceOfConcern(name_iupac="Lead")
-        conc = Concentration(value=Decimal("0.15"), unit="%w/w")
-        threshold = Threshold(value=Decimal("0.1"), unit="%w/w")
+        conc = Concentration(value=_D_0_15, unit="%w/w")
+        threshold = Threshold(value=_D_0_1, unit="%w/w")
 
         csoc = ConcentrationOfSubstanceOfConcern(
             substance=soc, concentration=conc, threshold=threshold
@@ -342,8 +389,8 @@ class TestConcentrationOfSubstanceOfConcern:
     def test_exceeds_threshold_false(self):
         """Test exceeds_threshold returns False."""
         soc = SubstanceOfConcern(name_iupac="Lead")
-        conc = Concentration(value=Decimal("0.05"), unit="%w/w")
-        threshold = Threshold(value=Decimal("0.1"), unit="%w/w")
+        conc = Concentration(value=_D_0_05, unit="%w/w")
+        threshold = Threshold(value=_D_0_1, unit="%w/w")
 
         csoc = ConcentrationOfSubstanceOfConcern(
             substance=soc, concentration=conc, threshold=threshold
@@ -353,7 +400,7 @@ class TestConcentrationOfSubstanceOfConcern:
     def test_exceeds_threshold_no_threshold(self):
         """Test exceeds_threshold returns None without threshold."""
         soc = SubstanceOfConcern(name_iupac="Lead")
-        conc = Concentration(value=Decimal("0.15"), unit="%w/w")
+        conc = Concentration(value=_D_0_15, unit="%w/w")
 
         csoc = ConcentrationOfSubstanceOfConcern(substance=soc, concentration=conc, threshold=None)
         assert csoc.exceeds_threshold() is None
@@ -361,8 +408,8 @@ class TestConcentrationOfSubstanceOfConcern:
     def test_exceeds_threshold_different_units(self):
         """Test exceeds_threshold returns None for different units."""
         soc = SubstanceOfConcern(name_iupac="Lead")
-        conc = Concentration(value=Decimal("1500"), unit="ppm")
-        threshold = Threshold(value=Decimal("0.1"), unit="%w/w")
+        conc = Concentration(value=_D_1500, unit="ppm")
+        threshold = Threshold(value=_D_0_1, unit="%w/w")
 
         csoc = ConcentrationOfSubstanceOfConcern(
             substance=soc, concentration=conc, threshold=threshold
@@ -1,8 +1,12 @@
 """Tests for exporters."""
 
-import json
 from datetime import datetime, timezone
 
+try:
+    from orjson import loads as _jloads
+except ImportError:  # pragma: no cover - orjson is a dev convenience
+    from json import loads as _jloads
+
 import pytest
 
 from dppvalidator.exporters import (
@@ -12,30 +16,76 @@ from dppvalidator.exporters import (
     export_json,
     export_jsonld,
 )
-from dppvalidator.models import CredentialIssuer, DigitalProductPassport, Product, ProductPassport
+from dppvalidator.models import (
+    CredentialIssuer,
+    DigitalProductPassport,
+    Material,
+    Product,
+    ProductPassport,
+)
+from dppvalidator.validators import ValidationEngine
+
+# Fully validated once at import; round-trip passports derive from it via
+# model_copy, which skips per-field revalidation.
+_PROTOTYPE = DigitalProductPassport(
+    id="https://example.com/credentials/dpp-proto",
+    issuer=CredentialIssuer(
+        id="https://example.com/issuers/proto",
+        name="Prototype Company",
+    ),
+    validFrom=datetime(2024, 1, 1, tzinfo=timezone.utc),
+    validUntil=datetime(2034, 1, 1, tzinfo=timezone.utc),
+    credentialSubject=ProductPassport(
+        product=Product(
+            id="https://example.com/products/proto",
+            name="Test Product",
+        ),
+    ),
+)
 
 
 def _make_valid_passport(
     id_suffix: str = "001", name: str = "Test Company"
 ) -> DigitalProductPassport:
-    """Create a CIRPASS-compliant passport for testing."""
+    """Create a CIRPASS-compliant passport for testing.
+
+    Copies deep so tests can mutate the nested credential subject without
+    touching the shared prototype.
+    """
+    return _PROTOTYPE.model_copy(
+        deep=True,
+        update={
+            "id": f"https://example.com/credentials/dpp-{id_suffix}",
+            "issuer": CredentialIssuer(
+                id=f"https://example.com/issuers/{id_suffix}",
+                name=name,
+            ),
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_passport() -> DigitalProductPassport:
+    """Create one minimal passport shared by all exporter tests in this module.
+
+    The exporters never mutate their input, so a single instance is safe to
+    reuse and avoids re-running Pydantic validation for every test.
+    """
     return DigitalProductPassport(
-        id=f"https://example.com/credentials/dpp-{id_suffix}",
+        id="https://example.com/credentials/dpp-001",
         issuer=CredentialIssuer(
-            id=f"https://example.com/issuers/{id_suffix}",
-            name=name,
-        ),
-        validFrom=datetime(2024, 1, 1, tzinfo=timezone.utc),
-        validUntil=datetime(2034, 1, 1, tzinfo=timezone.utc),
-        credentialSubject=ProductPassport(
-            product=Product(
-                id=f"https://example.com/products/{id_suffix}",
-                name="Test Product",
-            ),
+            id="https://example.com/issuers/001",
+            name="Example Company Ltd",
         ),
     )
 
 
+@pytest.fixture(scope="module")
+def default_context() -> list[str]:
+    """Default context URLs, computed once for the module."""
+    return ContextManager().get_context()
+
+
 class TestContextManager:
     """Tests for ContextManager."""
 
@@ -44,12 +94,10 @@ class TestContextManager:
         manager = ContextManager()
         assert manager.version == "0.6.1"
 
-    def test_get_context(self):
+    def test_get_context(self, default_context: list[str]):
         """Test getting context URLs."""
-        manager = ContextManager()
-        context = manager.get_context()
-        assert "https://www.w3.org/ns/credentials/v2" in context
-        assert any("untp/dpp/0.6.1" in url for url in context)
+        assert "https://www.w3.org/ns/credentials/v2" in default_context
+        assert any("untp/dpp/0.6.1" in url for url in default_context)
 
     def test_get_type(self):
         """Test getting type array."""
@@ -58,11 +106,9 @@ class TestContextManager:
         assert "DigitalProductPassport" in types
         assert "VerifiableCredential" in types
 
-    def test_validate_context_valid(self):
+    def test_validate_context_valid(self, default_context: list[str]):
         """Test validating correct context."""
-        manager = ContextManager()
-        context = manager.get_context()
-        assert manager.validate_context(context) is True
+        assert ContextManager().validate_context(default_context) is True
 
     def test_validate_context_invalid(self):
         """Test validating incorrect context."""
@@ -80,110 +126,94 @@ class TestContextManager:
 class TestJSONLDExporter:
     """Tests for JSONLDExporter."""
 
-    @pytest.fixture
-    def passport(self) -> DigitalProductPassport:
-        """Create test passport."""
-        return DigitalProductPassport(
-            id="https://example.com/credentials/dpp-001",
-            issuer=CredentialIssuer(
-                id="https://example.com/issuers/001",
-                name="Example Company Ltd",
-            ),
-        )
-
-    def test_export_string(self, passport: DigitalProductPassport):
+    def test_export_string(self, sample_passport: DigitalProductPassport):
         """Test exporting to string."""
         exporter = JSONLDExporter()
-        result = exporter.export(passport)
+        result = exporter.export(sample_passport)
         assert isinstance(result, str)
-        data = json.loads(result)
+        data = _jloads(result)
         assert "@context" in data
 
-    def test_export_dict(self, passport: DigitalProductPassport):
+    def test_export_dict(self, sample_passport: DigitalProductPassport):
         """Test exporting to dictionary."""
         exporter = JSONLDExporter()
-        result = exporter.export_dict(passport)
+        result = exporter.export_dict(sample_passport)
         assert isinstance(result, dict)
         assert "@context" in result
 
-    def test_export_includes_context(self, passport: DigitalProductPassport):
+    def test_export_includes_context(self, sample_passport: DigitalProductPassport):
         """Test that export includes W3C VC context."""
         exporter = JSONLDExporter()
-        result = exporter.export_dict(passport)
+        result = exporter.export_dict(sample_passport)
         assert "https://www.w3.org/ns/credentials/v2" in result["@context"]
 
-    def test_export_compact(self, passport: DigitalProductPassport):
+    def test_export_compact(self, sample_passport: DigitalProductPassport):
         """Test compact export (no indentation)."""
         exporter = JSONLDExporter()
-        result = exporter.export(passport, indent=None)
+        result = exporter.export(sample_passport, indent=None)
         assert "\n" not in result
 
-    def test_convenience_function(self, passport: DigitalProductPassport):
+    def test_convenience_function(self, sample_passport: DigitalProductPassport):
         """Test export_jsonld convenience function."""
-        result = export_jsonld(passport)
-        data = json.loads(result)
+        result = export_jsonld(sample_passport)
+        data = _jloads(result)
         assert "@context" in data
 
 
 class TestJSONExporter:
     """Tests for JSONExporter."""
 
-    @pytest.fixture
-    def passport(self) -> DigitalProductPassport:
-        """Create test passport."""
-        return DigitalProductPassport(
-            id="https://example.com/credentials/dpp-001",
-            issuer=CredentialIssuer(
-                id="https://example.com/issuers/001",
-                name="Example Company Ltd",
-            ),
-        )
-
-    def test_export_string(self, passport: DigitalProductPassport):
+    def test_export_string(self, sample_passport: DigitalProductPassport):
         """Test exporting to string."""
         exporter = JSONExporter()
-        result = exporter.export(passport)
+        result = exporter.export(sample_passport)
         assert isinstance(result, str)
-        data = json.loads(result)
+        data = _jloads(result)
         assert "issuer" in data
 
-    def test_export_dict(self, passport: DigitalProductPassport):
+    def test_export_dict(self, sample_passport: DigitalProductPassport):
         """Test exporting to dictionary."""
         exporter = JSONExporter()
-        result = exporter.export_dict(passport)
+        result = exporter.export_dict(sample_passport)
         assert isinstance(result, dict)
 
-    def test_export_excludes_none(self, passport: DigitalProductPassport):
+    def test_export_excludes_none(self, sample_passport: DigitalProductPassport):
         """Test that None values are excluded."""
         exporter = JSONExporter(exclude_none=True)
-        result = exporter.export_dict(passport)
+        result = exporter.export_dict(sample_passport)
         assert result.get("credentialSubject") is None or "credentialSubject" not in result
 
-    def test_convenience_function(self, passport: DigitalProductPassport):
+    def test_convenience_function(self, sample_passport: DigitalProductPassport):
         """Test export_json convenience function."""
-        result = export_json(passport)
-        data = json.loads(result)
+        result = export_json(sample_passport)
+        data = _jloads(result)
         assert "issuer" in data
 
 
+@pytest.fixture(scope="module")
+def engine() -> ValidationEngine:
+    """One ValidationEngine shared by the round-trip tests."""
+    return ValidationEngine()
+
+
+@pytest.fixture(scope="module")
+def jsonld_exporter() -> JSONLDExporter:
+    """One JSONLDExporter shared by the round-trip tests."""
+    return JSONLDExporter()
+
+
 class TestRoundTrip:
     """Round-trip tests: parse → export → parse."""
 
-    def test_roundtrip_jsonld_minimal(self):
+    def test_roundtrip_jsonld_minimal(self, engine, jsonld_exporter: JSONLDExporter):
         """Test round-trip with minimal passport via JSON-LD."""
-        from dppvalidator.validators import ValidationEngine
-
         original = _make_valid_passport("001", "Round Trip Test Company")
 
-        # Export to JSON-LD
-        exporter = JSONLDExporter()
-        exported_json = exporter.export(original)
-
-        # Parse exported JSON
-        exported_data = json.loads(exported_json)
+        # Export to JSON-LD and validate; the string export path is covered
+        # by TestJSONLDExporter.test_export_string.
+        exported_data = jsonld_exporter.export_dict(original)
 
         # Validate and re-parse
-        engine = ValidationEngine()
         result = engine.validate(exported_data)
 
         # Verify round-trip success
@@ -192,10 +222,8 @@ class TestRoundTrip:
         assert str(result.passport.id) == str(original.id)
         assert result.passport.issuer.name == original.issuer.name
 
-    def test_roundtrip_json_minimal(self):
+    def test_roundtrip_json_minimal(self, engine):
         """Test round-trip with minimal passport via plain JSON."""
-        from dppvalidator.validators import ValidationEngine
-
         original = _make_valid_passport("002", "JSON Round Trip Co")
 
         # Export to JSON
@@ -203,29 +231,23 @@ class TestRoundTrip:
         exported_json = exporter.export(original)
 
         # Parse and validate
-        exported_data = json.loads(exported_json)
-        engine = ValidationEngine()
+        exported_data = _jloads(exported_json)
         result = engine.validate(exported_data)
 
         assert result.valid is True
         assert result.passport is not None
         assert result.passport.issuer.name == original.issuer.name
 
-    def test_roundtrip_with_product(self):
+    def test_roundtrip_with_product(self, engine, jsonld_exporter: JSONLDExporter):
         """Test round-trip with product data."""
-        from dppvalidator.validators import ValidationEngine
-
         original = _make_valid_passport("003", "Product Test Inc")
         # Override the product with custom data
         original.credential_subject.product.name = "Premium Widget"
         original.credential_subject.product.serial_number = "SN-12345"
 
-        # Export and re-parse
-        exporter = JSONLDExporter()
-        exported = exporter.export(original)
-        data = json.loads(exported)
+        # Export and validate
+        data = jsonld_exporter.export_dict(original)
 
-        engine = ValidationEngine()
         result = engine.validate(data)
 
         assert result.valid is True
@@ -235,11 +257,8 @@ class TestRoundTrip:
         assert result.passport.credential_subject.product.name == "Premium Widget"
         assert result.passport.credential_subject.product.serial_number == "SN-12345"
 
-    def test_roundtrip_with_materials(self):
+    def test_roundtrip_with_materials(self, engine, jsonld_exporter: JSONLDExporter):
         """Test round-trip with materials data."""
-        from dppvalidator.models import Material
-        from dppvalidator.validators import ValidationEngine
-
         original = _make_valid_passport("004", "Materials Test Ltd")
         # Add materials to the credential subject
         original.credential_subject.materials_provenance = [
@@ -247,12 +266,9 @@ class TestRoundTrip:
             Material(name="Plastic", mass_fraction=0.4),
         ]
 
-        # Export and re-parse
-        exporter = JSONLDExporter()
-        exported = exporter.export(original)
-        data = json.loads(exported)
+        # Export and validate
+        data = jsonld_exporter.export_dict(original)
 
-        engine = ValidationEngine()
         result = engine.validate(data)
 
         assert result.valid is True
@@ -264,20 +280,15 @@ class TestRoundTrip:
         assert materials[0].name == "Steel"
         assert materials[0].mass_fraction == 0.6
 
-    def test_roundtrip_with_dates(self):
+    def test_roundtrip_with_dates(self, engine, jsonld_exporter: JSONLDExporter):
         """Test round-trip preserves dates."""
-        from dppvalidator.validators import ValidationEngine
-
         original = _make_valid_passport("005", "Dates Test Corp")
         # Update dates
         original.valid_from = datetime(2024, 1, 1, tzinfo=timezone.utc)
         original.valid_until = datetime(2034, 12, 31, tzinfo=timezone.utc)
 
-        exporter = JSONLDExporter()
-        exported = exporter.export(original)
-        data = json.loads(exported)
+        data = jsonld_exporter.export_dict(original)
 
-        engine = ValidationEngine()
         result = engine.validate(data)
 
         assert result.valid is True
@@ -288,43 +299,33 @@ class TestRoundTrip:
         assert result.passport.valid_from.year == 2024
         assert result.passport.valid_until.year == 2034
 
-    def test_roundtrip_dict_export(self):
+    def test_roundtrip_dict_export(self, engine, jsonld_exporter: JSONLDExporter):
         """Test round-trip using export_dict."""
-        from dppvalidator.validators import ValidationEngine
-
         original = _make_valid_passport("006", "Dict Export Test")
 
-        exporter = JSONLDExporter()
-        data = exporter.export_dict(original)
+        data = jsonld_exporter.export_dict(original)
 
-        engine = ValidationEngine()
         result = engine.validate(data)
 
         assert result.valid is True
         assert result.passport is not None
 
-    def test_roundtrip_preserves_context(self):
+    def test_roundtrip_preserves_context(self, engine, jsonld_exporter: JSONLDExporter):
         """Test round-trip preserves @context."""
         original = _make_valid_passport("007", "Context Test")
 
-        exporter = JSONLDExporter()
-        data = exporter.export_dict(original)
+        data = jsonld_exporter.export_dict(original)
 
         # Verify context is present
         assert "@context" in data
         assert "https://www.w3.org/ns/credentials/v2" in data["@context"]
 
-        # Re-export should preserve context
-        from dppvalidator.validators import ValidationEngine
-
-        engine = ValidationEngine()
         result = engine.validate(data)
         assert result.valid is True
 
-        # Export again
-        if result.passport:
-            re_exported = exporter.export_dict(result.passport)
-            assert "@context" in re_exported
+        # Re-export must reproduce the same context, not merely contain one
+        assert result.passport is not None
+        assert jsonld_exporter.export_dict(result.passport)["@context"] == data["@context"]
 
 
 class TestExporterEdgeCases:
@@ -342,60 +343,52 @@ class TestExporterEdgeCases:
         # Should fall back to default
         assert len(context) > 0
 
-    def test_json_exporter_include_none(self):
+    def test_json_exporter_include_none(self, sample_passport: DigitalProductPassport):
         """Test JSONExporter with exclude_none=False."""
-        passport = DigitalProductPassport(
-            id="https://example.com/dpp",
-            issuer=CredentialIssuer(id="https://example.com/issuer", name="Test"),
-        )
         exporter = JSONExporter(exclude_none=False)
-        data = exporter.export_dict(passport)
+        data = exporter.export_dict(sample_passport)
         # Should include None values
         assert data is not None
 
-    def test_json_exporter_no_alias(self):
+    def test_json_exporter_no_alias(self, sample_passport: DigitalProductPassport):
         """Test JSONExporter with by_alias=False."""
-        passport = DigitalProductPassport(
-            id="https://example.com/dpp",
-            issuer=CredentialIssuer(id="https://example.com/issuer", name="Test"),
-        )
         exporter = JSONExporter()
-        data = exporter.export_dict(passport, by_alias=False)
+        data = exporter.export_dict(sample_passport, by_alias=False)
         # Uses snake_case field names
         assert data is not None
 
 
+@pytest.fixture(scope="module")
+def out_dir(tmp_path_factory):
+    """One temporary directory shared by the file-export tests."""
+    return tmp_path_factory.mktemp("exports")
+
+
 class TestExportToFile:
     """Tests for file export functionality."""
 
-    def test_jsonld_export_to_file(self, tmp_path):
+    @pytest.mark.slow
+    def test_jsonld_export_to_file(self, sample_passport: DigitalProductPassport, out_dir):
         """Test JSONLDExporter export_to_file."""
-        passport = DigitalProductPassport(
-            id="https://example.com/dpp",
-            issuer=CredentialIssuer(id="https://example.com/issuer", name="File Test"),
-        )
-        output_path = tmp_path / "output.jsonld"
+        output_path = out_dir / "output.jsonld"
 
         exporter = JSONLDExporter()
-        exporter.export_to_file(passport, output_path)
+        exporter.export_to_file(sample_passport, output_path)
 
         assert output_path.exists()
         content = output_path.read_text(encoding="utf-8")
-        data = json.loads(content)
+        data = _jloads(content)
         assert "@context" in data
 
-    def test_json_export_to_file(self, tmp_path):
+    @pytest.mark.slow
+    def test_json_export_to_file(self, sample_passport: DigitalProductPassport, out_dir):
         """Test JSONExporter export_to_file."""
-        passport = DigitalProductPassport(
-            id="https://example.com/dpp",
-            issuer=CredentialIssuer(id="https://example.com/issuer", name="File Test"),
-        )
-        output_path = tmp_path / "output.json"
+        output_path = out_dir / "output.json"
 
         exporter = JSONExporter()
-        exporter.export_to_file(passport, output_path)
+        exporter.export_to_file(sample_passport, output_path)
 
         assert output_path.exists()
         content = output_path.read_text(encoding="utf-8")
-        data = json.loads(content)
+        data = _jloads(content)
         assert "issuer" in data
@@ -2,8 +2,12 @@
 
 import argparse
 import json
+import shutil
+from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 from dppvalidator.cli.commands.init import (
     EXIT_ERROR,
     EXIT_SUCCESS,
@@ -16,8 +20,17 @@ from dppvalidator.cli.commands.init import (
 )
 
 
+def _load(path: Path) -> dict:
+    """Parse a JSON file from raw bytes, skipping the intermediate str decode."""
+    return json.loads(path.read_bytes())
+
+
+# Pre-encoded payload for the overwrite tests; shared across parametrized runs
+_EXISTING_JSON = b'{"existing": "data"}'
+
+
 def make_args(
-    path=".",
+    path: str | Path = ".",
     template="minimal",
     pre_commit=False,
     force=False,
@@ -25,9 +38,12 @@ def make_args(
     config=False,
     readme=True,
 ):
-    """Create argparse.Namespace with all required init command args."""
+    """Create argparse.Namespace with all required init command args.
+
+    Accepts Path objects directly so call sites do not repeat str().
+    """
     return argparse.Namespace(
-        path=path,
+        path=str(path),
         template=template,
         pre_commit=pre_commit,
         force=force,
@@ -37,85 +53,112 @@ def make_args(
     )
 
 
-class TestAddParser:
-    """Tests for init parser setup."""
+@pytest.fixture(scope="session")
+def noop_console():
+    """Shared console mock for tests that never assert on console calls."""
+    return MagicMock()
 
-    def test_adds_init_subcommand(self):
-        """Parser adds init subcommand."""
-        import argparse
 
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-        init_parser = add_parser(subparsers)
+@pytest.fixture(scope="session")
+def scaffolded_project(tmp_path_factory, noop_console):
+    """Scaffold the minimal template once per session.
 
-        assert init_parser is not None
+    Read-only tests copy this tree instead of re-running init, so the
+    directory creation and JSON serialization happen a single time.
+    """
+    template_dir = tmp_path_factory.mktemp("init_template")
+    run(make_args(path=template_dir), noop_console)
+    return template_dir
 
-    def test_parser_has_path_argument(self):
-        """Parser accepts optional path argument."""
-        import argparse
 
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-        add_parser(subparsers)
+@pytest.fixture
+def project_dir(scaffolded_project, tmp_path):
+    """Per-test copy of the scaffolded minimal project."""
+    dest = tmp_path / "project"
+    shutil.copytree(scaffolded_project, dest)
+    return dest
 
-        args = parser.parse_args(["init", "/some/path"])
-        assert args.path == "/some/path"
 
-    def test_parser_default_path_is_current_dir(self):
-        """Parser defaults to current directory."""
-        import argparse
+@pytest.fixture(scope="module")
+def init_base(tmp_path_factory):
+    """Shared base directory for the write-heavy init tests.
 
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-        add_parser(subparsers)
+    One numbered tmp directory per module; each test isolates itself in a
+    named subdirectory instead of requesting a fresh tmp_path.
+    """
+    return tmp_path_factory.mktemp("init_runs")
 
-        args = parser.parse_args(["init"])
-        assert args.path == "."
 
-    def test_parser_has_template_option(self):
-        """Parser accepts --template option."""
-        import argparse
+@pytest.fixture(scope="session")
+def full_template_project(tmp_path_factory, noop_console):
+    """Scaffold the full template once per session."""
+    template_dir = tmp_path_factory.mktemp("init_full_template")
+    run(make_args(path=template_dir, template="full"), noop_console)
+    return template_dir
 
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-        add_parser(subparsers)
 
-        args = parser.parse_args(["init", "--template", "full"])
-        assert args.template == "full"
+@pytest.fixture(scope="session")
+def init_cli_parser() -> argparse.ArgumentParser:
+    """Build the CLI parser with the init subcommand once per session.
 
-    def test_parser_has_pre_commit_flag(self):
-        """Parser accepts --pre-commit flag."""
-        import argparse
+    parse_args does not mutate the parser, so every TestAddParser test can
+    share this instance.
+    """
+    parser = argparse.ArgumentParser()
+    subparsers = parser.add_subparsers()
+    assert add_parser(subparsers) is not None
+    return parser
 
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-        add_parser(subparsers)
 
-        args = parser.parse_args(["init", "--pre-commit"])
-        assert args.pre_commit is True
+class TestAddParser:
+    """Tests for init parser setup."""
 
-    def test_parser_has_force_flag(self):
-        """Parser accepts --force flag."""
-        import argparse
+    def test_adds_init_subcommand(self, init_cli_parser):
+        """Parser adds init subcommand."""
+        args = init_cli_parser.parse_args(["init"])
+        assert args is not None
+
+    def test_parser_has_path_argument(self, init_cli_parser):
+        """Parser accepts optional path argument."""
+        args = init_cli_parser.parse_args(["init", "/some/path"])
+        assert args.path == "/some/path"
 
-        parser = argparse.ArgumentParser()
-        subparsers = parser.add_subparsers()
-        add_parser(subparsers)
+    def test_parser_default_path_is_current_dir(self, init_cli_parser):
+        """Parser defaults to current directory."""
+        args = init_cli_parser.parse_args(["init"])
+        assert args.path == "."
+
+    def test_parser_has_template_option(self, init_cli_parser):
+        """Parser accepts --template option."""
+        args = init_cli_parser.parse_args(["init", "--template", "full"])
+        assert args.template == "full"
+
+    def test_parser_has_pre_commit_flag(self, init_cli_parser):
+        """Parser accepts --pre-commit flag."""
+        args = init_cli_parser.parse_args(["init", "--pre-commit"])
+        assert args.pre_commit is True
 
-        args = parser.parse_args(["init", "--force"])
+    def test_parser_has_force_flag(self, init_cli_parser):
+        """Parser accepts --force flag."""
+        args = init_cli_parser.parse_args(["init", "--force"])
         assert args.force is True
 
 
+@pytest.mark.xdist_group("init_io")
 class TestInitRun:
-    """Tests for init run command."""
+    """Tests for init run command.
 
-    def test_creates_project_structure(self, tmp_path):
+    Grouped for pytest-xdist so the filesystem-heavy tests land on one
+    worker (run with -n auto --dist loadgroup) and share their scoped
+    fixtures there.
+    """
+
+    def test_creates_project_structure(self, init_base, noop_console):
         """Init creates expected project structure."""
-        console = MagicMock()
-        project_dir = tmp_path / "new_project"
-        args = make_args(path=str(project_dir))
+        project_dir = init_base / "new_project"
+        args = make_args(path=project_dir)
 
-        result = run(args, console)
+        result = run(args, noop_console)
 
         assert result == EXIT_SUCCESS
         assert project_dir.exists()
@@ -123,116 +166,102 @@ class TestInitRun:
         assert (project_dir / "data" / "sample_passport.json").exists()
         assert (project_dir / ".gitignore").exists()
 
-    def test_creates_minimal_template(self, tmp_path):
+    def test_creates_minimal_template(self, project_dir):
         """Init creates minimal DPP template by default."""
-        console = MagicMock()
-        args = make_args(path=str(tmp_path))
-
-        run(args, console)
-
-        dpp_file = tmp_path / "data" / "sample_passport.json"
-        content = json.loads(dpp_file.read_text(encoding="utf-8"))
+        dpp_file = project_dir / "data" / "sample_passport.json"
+        content = _load(dpp_file)
 
         assert content["type"] == MINIMAL_DPP_TEMPLATE["type"]
         assert "credentialSubject" in content
 
-    def test_creates_full_template(self, tmp_path):
+    def test_creates_full_template(self, full_template_project):
         """Init creates full DPP template when requested."""
-        console = MagicMock()
-        args = make_args(path=str(tmp_path), template="full")
-
-        run(args, console)
-
-        dpp_file = tmp_path / "data" / "sample_passport.json"
-        content = json.loads(dpp_file.read_text(encoding="utf-8"))
+        dpp_file = full_template_project / "data" / "sample_passport.json"
+        content = _load(dpp_file)
 
         assert "materialsProvenance" in content["credentialSubject"]
         assert "circularityScorecard" in content["credentialSubject"]
 
-    def test_creates_gitignore(self, tmp_path):
+    def test_creates_gitignore(self, project_dir):
         """Init creates .gitignore with expected content."""
-        console = MagicMock()
-        args = make_args(path=str(tmp_path))
-
-        run(args, console)
-
-        gitignore = tmp_path / ".gitignore"
+        gitignore = project_dir / ".gitignore"
         content = gitignore.read_text(encoding="utf-8")
 
         assert ".dppvalidator/" in content
         assert "__pycache__/" in content
 
-    def test_creates_pre_commit_config_when_requested(self, tmp_path):
+    def test_creates_pre_commit_config_when_requested(self, init_base, noop_console):
         """Init creates pre-commit config when --pre-commit flag used."""
-        console = MagicMock()
-        args = make_args(path=str(tmp_path), pre_commit=True)
+        project = init_base / "pre_commit"
+        project.mkdir()
+        args = make_args(path=project, pre_commit=True)
 
-        run(args, console)
+        run(args, noop_console)
 
-        precommit = tmp_path / ".pre-commit-config.yaml"
+        precommit = project / ".pre-commit-config.yaml"
         assert precommit.exists()
         content = precommit.read_text(encoding="utf-8")
         assert "dppvalidator" in content
 
-    def test_does_not_create_pre_commit_by_default(self, tmp_path):
+    def test_does_not_create_pre_commit_by_default(self, project_dir):
         """Init does not create pre-commit config by default."""
-        console = MagicMock()
-        args = make_args(path=str(tmp_path))
-
-        run(args, console)
-
-        precommit = tmp_path / ".pre-commit-config.yaml"
+        precommit = project_dir / ".pre-commit-config.yaml"
         assert not precommit.exists()
 
-    def test_does_not_overwrite_existing_files(self, tmp_path):
-        """Init does not overwrite existing files without --force."""
-        console = MagicMock()
+    @pytest.mark.parametrize(
+        ("force", "expect_preserved"),
+        [(False, True), (True, False)],
+        ids=["no_force_preserves", "force_overwrites"],
+    )
+    def test_overwrite_semantics(self, init_base, noop_console, force, expect_preserved):
+        """Init overwrites existing files only with --force."""
+        project = init_base / f"overwrite_force_{force}"
 
         # Create existing file
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
+        data_dir = project / "data"
+        data_dir.mkdir(parents=True)
         existing_file = data_dir / "sample_passport.json"
-        existing_file.write_text('{"existing": "data"}')
+        existing_file.write_bytes(_EXISTING_JSON)
 
-        args = make_args(path=str(tmp_path))
+        run(make_args(path=project, force=force), noop_console)
 
-        run(args, console)
+        content = _load(existing_file)
+        assert ("existing" in content) is expect_preserved
+        if not expect_preserved:
+            assert "type" in content
 
-        # Original content preserved
-        content = json.loads(existing_file.read_text(encoding="utf-8"))
-        assert content == {"existing": "data"}
-
-    def test_overwrites_files_with_force_flag(self, tmp_path):
-        """Init overwrites existing files with --force flag."""
+    def test_handles_permission_error(self, tmp_path, monkeypatch):
+        """Init handles permission errors gracefully."""
         console = MagicMock()
+        args = make_args(path=tmp_path / "test_project")
 
-        # Create existing file
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        existing_file = data_dir / "sample_passport.json"
-        existing_file.write_text('{"existing": "data"}')
+        class _NoMkdirPath:
+            """Path stand-in whose mkdir raises (works cross-platform).
 
-        args = make_args(path=str(tmp_path), force=True)
+            Patching the init module's Path name rather than
+            pathlib.Path.mkdir globally leaves pytest's own tmp_path
+            machinery untouched.
+            """
 
-        run(args, console)
+            def __init__(self, *parts):
+                self._path = Path(*parts)
 
-        # Content replaced
-        content = json.loads(existing_file.read_text(encoding="utf-8"))
-        assert "type" in content
-        assert "existing" not in content
+            def resolve(self):
+                return self
 
-    def test_handles_permission_error(self, tmp_path, monkeypatch):
-        """Init handles permission errors gracefully."""
-        console = MagicMock()
-        args = make_args(path=str(tmp_path / "test_project"))
+            def mkdir(self, *_args, **_kwargs):
+                raise PermissionError("Permission denied")
 
-        # Mock Path.mkdir to raise PermissionError (works cross-platform)
-        from pathlib import Path
+            def __getattr__(self, name):
+                return getattr(self._path, name)
 
-        def mock_mkdir(_self, *_args, **_kwargs):
-            raise PermissionError("Permission denied")
+            def __truediv__(self, other):
+                return self._path / other
 
-        monkeypatch.setattr(Path, "mkdir", mock_mkdir)
+            def __str__(self):
+                return str(self._path)
+
+        monkeypatch.setattr("dppvalidator.cli.commands.init.Path", _NoMkdirPath)
 
         result = run(args, console)
 
@@ -244,14 +273,14 @@ class TestInitRun:
 class TestTemplates:
     """Tests for DPP templates."""
 
-    def test_minimal_template_is_valid_dpp(self):
-        """Minimal template is a valid DPP structure."""
-        assert "type" in MINIMAL_DPP_TEMPLATE
+    @pytest.mark.parametrize("key", ["type", "@context", "id", "issuer", "credentialSubject"])
+    def test_minimal_template_has_key(self, key):
+        """Minimal template contains the mandatory DPP keys."""
+        assert key in MINIMAL_DPP_TEMPLATE
+
+    def test_minimal_template_type(self):
+        """Minimal template declares the DPP credential type."""
         assert "DigitalProductPassport" in MINIMAL_DPP_TEMPLATE["type"]
-        assert "@context" in MINIMAL_DPP_TEMPLATE
-        assert "id" in MINIMAL_DPP_TEMPLATE
-        assert "issuer" in MINIMAL_DPP_TEMPLATE
-        assert "credentialSubject" in MINIMAL_DPP_TEMPLATE
 
     def test_full_template_has_materials(self):
         """Full template includes materials provenance."""
@@ -279,13 +308,10 @@ class TestTemplates:
 class TestGitignoreContent:
     """Tests for .gitignore template."""
 
-    def test_ignores_dppvalidator_cache(self):
-        """Gitignore includes .dppvalidator directory."""
-        assert ".dppvalidator/" in GITIGNORE_CONTENT
-
-    def test_ignores_python_cache(self):
-        """Gitignore includes Python cache directories."""
-        assert "__pycache__/" in GITIGNORE_CONTENT
+    @pytest.mark.parametrize("token", [".dppvalidator/", "__pycache__/"])
+    def test_ignores_cache_directories(self, token):
+        """Gitignore includes the validator and Python cache directories."""
+        assert token in GITIGNORE_CONTENT
 
 
 class TestPreCommitConfig:
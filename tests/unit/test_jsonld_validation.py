@@ -1,5 +1,7 @@
 """Unit tests for JSON-LD semantic validation."""
 
+import pytest
+
 from dppvalidator.validators.jsonld_semantic import (
     UNTP_CONTEXT_PATTERNS,
     CachingDocumentLoader,
@@ -8,21 +10,25 @@ from dppvalidator.validators.jsonld_semantic import (
 from dppvalidator.validators.results import ValidationResult
 
 
+@pytest.fixture(scope="module")
+def validator() -> JSONLDValidator:
+    """One default-configured validator shared by the pure-logic tests."""
+    return JSONLDValidator()
+
+
 class TestContextPresenceValidation:
     """Tests for @context presence validation."""
 
-    def test_missing_context_returns_error(self) -> None:
+    def test_missing_context_returns_error(self, validator: JSONLDValidator) -> None:
         """Missing @context returns JLD001 error."""
-        validator = JSONLDValidator()
         result = validator._validate_context_presence({})
 
         assert result is not None
         assert result.code == "JLD001"
         assert "Missing @context" in result.message
 
-    def test_context_without_untp_returns_error(self) -> None:
+    def test_context_without_untp_returns_error(self, validator: JSONLDValidator) -> None:
         """@context without UNTP vocabulary returns error."""
-        validator = JSONLDValidator()
         result = validator._validate_context_presence(
             {"@context": ["https://example.com/other-context"]}
         )
@@ -31,9 +37,8 @@ class TestContextPresenceValidation:
         assert result.code == "JLD001"
         assert "missing UNTP" in result.message
 
-    def test_valid_untp_context_returns_none(self) -> None:
+    def test_valid_untp_context_returns_none(self, validator: JSONLDValidator) -> None:
         """Valid UNTP @context returns None (no error)."""
-        validator = JSONLDValidator()
         result = validator._validate_context_presence(
             {
                 "@context": [
@@ -45,9 +50,8 @@ class TestContextPresenceValidation:
 
         assert result is None
 
-    def test_valid_w3c_credentials_context(self) -> None:
+    def test_valid_w3c_credentials_context(self, validator: JSONLDValidator) -> None:
         """W3C credentials context is valid."""
-        validator = JSONLDValidator()
         result = validator._validate_context_presence(
             {"@context": ["https://www.w3.org/ns/credentials/v2"]}
         )
@@ -58,35 +62,31 @@ class TestContextPresenceValidation:
 class TestDroppedTermDetection:
     """Tests for detecting terms dropped during expansion."""
 
-    def test_collect_keys_basic(self) -> None:
+    def test_collect_keys_basic(self, validator: JSONLDValidator) -> None:
         """Collect keys from simple object."""
-        validator = JSONLDValidator()
         keys = validator._collect_keys({"name": "test", "value": 123}, "$")
 
         assert ("name", "$.name") in keys
         assert ("value", "$.value") in keys
 
-    def test_collect_keys_nested(self) -> None:
+    def test_collect_keys_nested(self, validator: JSONLDValidator) -> None:
         """Collect keys from nested object."""
-        validator = JSONLDValidator()
         keys = validator._collect_keys({"outer": {"inner": "value"}}, "$")
 
         key_names = [k for k, _ in keys]
         assert "outer" in key_names
         assert "inner" in key_names
 
-    def test_collect_keys_with_arrays(self) -> None:
+    def test_collect_keys_with_arrays(self, validator: JSONLDValidator) -> None:
         """Collect keys from objects in arrays."""
-        validator = JSONLDValidator()
         keys = validator._collect_keys({"items": [{"name": "first"}, {"name": "second"}]}, "$")
 
         key_names = [k for k, _ in keys]
         assert "items" in key_names
         assert key_names.count("name") == 2
 
-    def test_collect_expanded_iris(self) -> None:
+    def test_collect_expanded_iris(self, validator: JSONLDValidator) -> None:
         """Collect IRIs from expanded JSON-LD."""
-        validator = JSONLDValidator()
         iris: set[str] = set()
 
         expanded = {
@@ -104,9 +104,8 @@ class TestDroppedTermDetection:
 class TestUnprefixedTermDetection:
     """Tests for detecting unprefixed custom terms."""
 
-    def test_standard_terms_not_flagged(self) -> None:
+    def test_standard_terms_not_flagged(self, validator: JSONLDValidator) -> None:
         """Standard UNTP terms are not flagged."""
-        validator = JSONLDValidator()
         result = validator._find_unprefixed_custom_terms(
             {
                 "type": "DigitalProductPassport",
@@ -116,9 +115,8 @@ class TestUnprefixedTermDetection:
 
         assert len(result) == 0
 
-    def test_prefixed_terms_not_flagged(self) -> None:
+    def test_prefixed_terms_not_flagged(self, validator: JSONLDValidator) -> None:
         """Prefixed custom terms are not flagged."""
-        validator = JSONLDValidator()
         result = validator._find_unprefixed_custom_terms(
             {
                 "ex:customField": "value",
@@ -128,9 +126,8 @@ class TestUnprefixedTermDetection:
 
         assert len(result) == 0
 
-    def test_unprefixed_custom_terms_flagged(self) -> None:
+    def test_unprefixed_custom_terms_flagged(self, validator: JSONLDValidator) -> None:
         """Unprefixed custom terms are flagged."""
-        validator = JSONLDValidator()
         result = validator._find_unprefixed_custom_terms(
             {
                 "myCustomField": "value",
@@ -199,9 +196,8 @@ class TestUNTPContextPatterns:
 class TestValidatorIntegration:
     """Integration tests for full validation flow."""
 
-    def test_validator_with_valid_context(self) -> None:
+    def test_validator_with_valid_context(self, validator: JSONLDValidator) -> None:
         """Validator accepts valid UNTP context."""
-        validator = JSONLDValidator()
         data = {
             "@context": [
                 "https://www.w3.org/ns/credentials/v2",
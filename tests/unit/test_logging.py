@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from io import StringIO
 
+import pytest
+
 from dppvalidator.logging import (
     DEFAULT_FORMAT,
     LOGGER_NAME,
@@ -15,6 +17,19 @@ from dppvalidator.logging import (
 )
 
 
+@pytest.fixture(autouse=True)
+def _isolate_logging():
+    """Reset package logger handlers after each test.
+
+    One yield-based fixture replaces the per-class teardown_method hooks
+    so handler cleanup is defined once for the whole module.
+    """
+    yield
+    root_logger = logging.getLogger(LOGGER_NAME)
+    root_logger.handlers.clear()
+    root_logger.addHandler(logging.NullHandler())
+
+
 class TestGetLogger:
     """Tests for get_logger function."""
 
@@ -42,12 +57,6 @@ class TestGetLogger:
 class TestConfigureLogging:
     """Tests for configure_logging function."""
 
-    def teardown_method(self):
-        """Clean up logger handlers after each test."""
-        root_logger = logging.getLogger(LOGGER_NAME)
-        root_logger.handlers.clear()
-        root_logger.addHandler(logging.NullHandler())
-
     def test_configure_logging_default(self):
         """Configure logging with defaults."""
         configure_logging()
@@ -133,12 +142,6 @@ class TestConfigureLogging:
 class TestSetLevel:
     """Tests for set_level function."""
 
-    def teardown_method(self):
-        """Clean up logger handlers after each test."""
-        root_logger = logging.getLogger(LOGGER_NAME)
-        root_logger.handlers.clear()
-        root_logger.addHandler(logging.NullHandler())
-
     def test_set_level_with_int(self):
         """Set level with integer value."""
         configure_logging()
@@ -49,6 +49,37 @@ class TestModelValidator:
         assert validator._safe_input(True) is True
 
 
+class TestModelValidatorBatch:
+    """Tests for batch validation."""
+
+    def test_validate_many_returns_result_per_document(self):
+        """validate_many() yields one result per input, in order."""
+        validator = ModelValidator()
+        valid = {"id": "https://example.com/dpp", "issuer": {"id": "https://a.com", "name": "A"}}
+        docs = [valid if i % 2 == 0 else {"invalid": "data"} for i in range(100)]
+
+        results = validator.validate_many(docs)
+
+        assert len(results) == 100
+        assert all(r.valid for r in results[::2])
+        assert not any(r.valid for r in results[1::2])
+
+    def test_validate_many_empty_batch(self):
+        """validate_many() on an empty iterable returns an empty list."""
+        validator = ModelValidator()
+        assert validator.validate_many([]) == []
+
+    def test_validate_many_matches_single_validation(self):
+        """Batch results carry the same errors as single validation."""
+        validator = ModelValidator()
+        data = {"invalid": "data"}
+
+        (batch_result,) = validator.validate_many([data])
+        single_result = validator.validate(data)
+
+        assert [e.code for e in batch_result.errors] == [e.code for e in single_result.errors]
+
+
 class TestModelValidatorEdgeCases:
     """Edge case tests for ModelValidator."""
 
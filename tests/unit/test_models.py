@@ -1,7 +1,9 @@
 """Tests for UNTP DPP models."""
 
+from types import MappingProxyType
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from dppvalidator.models import (
     CircularityPerformance,
@@ -34,22 +36,135 @@ from dppvalidator.models import (
     TraceabilityPerformance,
 )
 
+# One TypeAdapter per model class; the validators are compiled once at import
+# and reused by every construction in this module
+_ADAPTERS = {
+    cls: TypeAdapter(cls)
+    for cls in (
+        CircularityPerformance,
+        Claim,
+        Classification,
+        CredentialIssuer,
+        CredentialStatus,
+        Criterion,
+        DigitalProductPassport,
+        Dimension,
+        EmissionsPerformance,
+        Facility,
+        IdentifierScheme,
+        Link,
+        Material,
+        Measure,
+        Metric,
+        Party,
+        Product,
+        ProductPassport,
+        Regulation,
+        SecureLink,
+        Standard,
+        TraceabilityPerformance,
+    )
+}
+
+
+def _make(cls, **kwargs):
+    """Construct a model instance through its prebuilt adapter."""
+    return _ADAPTERS[cls].validate_python(kwargs)
+
+
+# (model class, constructor kwargs, expected to_jsonld type entries); a list
+# expectation is matched exactly, a set is a membership check for the
+# multi-type classes whose full type array also carries supertypes
+JSONLD_CASES = [
+    (Measure, {"value": 50.5, "unit": "LTR"}, ["Measure"]),
+    (
+        CredentialIssuer,
+        {"id": "https://example.com/issuers/001", "name": "Test Corp"},
+        {"CredentialIssuer"},
+    ),
+    (Link, {"link_url": "https://example.com/doc"}, ["Link"]),
+    (SecureLink, {"link_url": "https://example.com/file.pdf"}, {"SecureLink", "Link"}),
+    (
+        Classification,
+        {"id": "https://vocabulary.example.com/class/001", "name": "Electronics"},
+        ["Classification"],
+    ),
+    (IdentifierScheme, {"name": "DUNS"}, ["IdentifierScheme"]),
+    (Party, {"id": "https://example.com/parties/001", "name": "Corp"}, ["Party"]),
+    (Facility, {"id": "https://example.com/facilities/001", "name": "Plant A"}, ["Facility"]),
+    (
+        EmissionsPerformance,
+        {
+            "carbon_footprint": 25.5,
+            "declared_unit": "KGM",
+            "operational_scope": OperationalScope.CRADLE_TO_GATE,
+            "primary_sourced_ratio": 0.8,
+        },
+        ["EmissionsPerformance"],
+    ),
+    (CircularityPerformance, {"recycled_content": 0.3}, ["CircularityPerformance"]),
+    (TraceabilityPerformance, {"verified_ratio": 0.8}, ["TraceabilityPerformance"]),
+    (
+        Criterion,
+        {
+            "id": "https://example.com/criteria/001",
+            "name": "Test",
+            "description": "Test criterion",
+            "conformity_topic": ConformityTopic.ENVIRONMENT_ENERGY,
+            "status": CriterionStatus.ACTIVE,
+        },
+        ["Criterion"],
+    ),
+    (
+        Standard,
+        {"name": "ISO 14001", "issuing_party": {"id": "https://iso.org", "name": "ISO"}},
+        ["Standard"],
+    ),
+    (
+        Regulation,
+        {"name": "ESPR", "administered_by": {"id": "https://ec.europa.eu", "name": "EC"}},
+        ["Regulation"],
+    ),
+    (
+        Claim,
+        {
+            "id": "https://example.com/claims/001",
+            "conformance": True,
+            "conformity_topic": ConformityTopic.ENVIRONMENT_EMISSIONS,
+        },
+        {"Claim", "Declaration"},
+    ),
+    (ProductPassport, {}, ["ProductPassport"]),
+    (Dimension, {}, ["Dimension"]),
+]
+
+
+@pytest.mark.parametrize(
+    ("cls", "kwargs", "expected"),
+    JSONLD_CASES,
+    ids=[cls.__name__ for cls, _, _ in JSONLD_CASES],
+)
+def test_to_jsonld(cls, kwargs, expected):
+    """Test that JSON-LD serialization emits the expected type entries."""
+    jsonld = _make(cls, **kwargs).to_jsonld()
+    if isinstance(expected, list):
+        assert jsonld["type"] == expected
+    else:
+        assert expected <= set(jsonld["type"])
+
 
 class TestMeasure:
     """Tests for Measure model."""
 
     def test_valid_measure(self):
         """Test creating a valid measure."""
-        measure = Measure(value=100.0, unit="KGM")
+        measure = _make(Measure, value=100.0, unit="KGM")
         assert measure.value == 100.0
         assert measure.unit == "KGM"
 
-    def test_measure_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        measure = Measure(value=50.5, unit="LTR")
-        jsonld = measure.to_jsonld()
-        assert jsonld["type"] == ["Measure"]
-        assert jsonld["value"] == 50.5
+    def test_measure_to_jsonld_value(self):
+        """Test JSON-LD serialization round-trips the value."""
+        assert _make(Measure, value=50.5, unit="LTR").to_jsonld()["value"] == 50.5
 
 
 class TestMaterial:
@@ -57,12 +172,13 @@ class TestMaterial:
 
     def test_valid_material(self):
         """Test creating a valid material."""
-        material = Material(name="Lithium Iron Phosphate")
+        material = _make(Material, name="Lithium Iron Phosphate")
         assert material.name == "Lithium Iron Phosphate"
 
     def test_material_with_mass_fraction(self):
         """Test material with mass fraction."""
-        material = Material(
+        material = _make(
+            Material,
             name="Steel",
             mass_fraction=0.6,
             origin_country="DE",
@@ -73,11 +189,12 @@ class TestMaterial:
     def test_hazardous_without_safety_info(self):
         """Test hazardous material requires safety info."""
         with pytest.raises(ValidationError, match="materialSafetyInformation"):
-            Material(name="Hazardous Chemical", hazardous=True)
+            _make(Material, name="Hazardous Chemical", hazardous=True)
 
     def test_hazardous_with_safety_info(self):
         """Test hazardous material with safety info."""
-        material = Material(
+        material = _make(
+            Material,
             name="Hazardous Chemical",
             hazardous=True,
             material_safety_information={"link_url": "https://example.com/msds"},
@@ -90,28 +207,21 @@ class TestCredentialIssuer:
 
     def test_valid_issuer(self):
         """Test creating a valid issuer."""
-        issuer = CredentialIssuer(
+        issuer = _make(
+            CredentialIssuer,
             id="https://example.com/issuers/001",
             name="Example Company Ltd",
         )
         assert issuer.name == "Example Company Ltd"
 
-    def test_issuer_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        issuer = CredentialIssuer(
-            id="https://example.com/issuers/001",
-            name="Test Corp",
-        )
-        jsonld = issuer.to_jsonld()
-        assert "CredentialIssuer" in jsonld["type"]
-
 
 class TestProduct:
     """Tests for Product model."""
 
     def test_valid_product(self):
         """Test creating a valid product."""
-        product = Product(
+        product = _make(
+            Product,
             id="https://example.com/products/001",
             name="EV Battery",
         )
@@ -119,7 +229,8 @@ class TestProduct:
 
     def test_product_with_serial_number(self):
         """Test product with serial number."""
-        product = Product(
+        product = _make(
+            Product,
             id="https://example.com/products/002",
             name="Battery Pack",
             serial_number="SN-2024-001",
@@ -131,46 +242,56 @@ class TestProduct:
 class TestDigitalProductPassport:
     """Tests for DigitalProductPassport model."""
 
-    @pytest.fixture
-    def minimal_dpp_data(self) -> dict:
-        """Minimal valid DPP data fixture."""
-        return {
-            "id": "https://example.com/credentials/dpp-001",
-            "issuer": {
-                "id": "https://example.com/issuers/001",
-                "name": "Example Company Ltd",
-            },
-        }
+    @pytest.fixture(scope="session")
+    def minimal_dpp_data(self) -> MappingProxyType:
+        """Minimal valid DPP data, built once and shared read-only."""
+        return MappingProxyType(
+            {
+                "id": "https://example.com/credentials/dpp-001",
+                "issuer": {
+                    "id": "https://example.com/issuers/001",
+                    "name": "Example Company Ltd",
+                },
+            }
+        )
 
-    def test_minimal_dpp(self, minimal_dpp_data: dict):
+    @pytest.fixture(scope="session")
+    def base_dpp(self, minimal_dpp_data: MappingProxyType) -> DigitalProductPassport:
+        """Pre-validated passport shared by the read-only tests."""
+        return _make(DigitalProductPassport, **minimal_dpp_data)
+
+    def test_minimal_dpp(self, base_dpp: DigitalProductPassport):
         """Test creating a minimal valid DPP."""
-        dpp = DigitalProductPassport(**minimal_dpp_data)
-        assert dpp.issuer.name == "Example Company Ltd"
+        assert base_dpp.issuer.name == "Example Company Ltd"
 
-    def test_dpp_default_context(self, minimal_dpp_data: dict):
+    def test_dpp_default_context(self, base_dpp: DigitalProductPassport):
         """Test DPP has default context."""
-        dpp = DigitalProductPassport(**minimal_dpp_data)
-        assert "https://www.w3.org/ns/credentials/v2" in dpp.context
+        assert "https://www.w3.org/ns/credentials/v2" in base_dpp.context
 
-    def test_dpp_with_dates(self, minimal_dpp_data: dict):
+    def test_dpp_with_dates(self, minimal_dpp_data: MappingProxyType):
         """Test DPP with validity dates."""
-        minimal_dpp_data["validFrom"] = "2024-01-01T00:00:00Z"
-        minimal_dpp_data["validUntil"] = "2034-01-01T00:00:00Z"
-        dpp = DigitalProductPassport(**minimal_dpp_data)
+        data = dict(
+            minimal_dpp_data,
+            validFrom="2024-01-01T00:00:00Z",
+            validUntil="2034-01-01T00:00:00Z",
+        )
+        dpp = _make(DigitalProductPassport, **data)
         assert dpp.valid_from is not None
         assert dpp.valid_until is not None
 
-    def test_dpp_invalid_date_order(self, minimal_dpp_data: dict):
+    def test_dpp_invalid_date_order(self, minimal_dpp_data: MappingProxyType):
         """Test DPP rejects validFrom >= validUntil."""
-        minimal_dpp_data["validFrom"] = "2034-01-01T00:00:00Z"
-        minimal_dpp_data["validUntil"] = "2024-01-01T00:00:00Z"
+        data = dict(
+            minimal_dpp_data,
+            validFrom="2034-01-01T00:00:00Z",
+            validUntil="2024-01-01T00:00:00Z",
+        )
         with pytest.raises(ValidationError, match="validFrom"):
-            DigitalProductPassport(**minimal_dpp_data)
+            _make(DigitalProductPassport, **data)
 
-    def test_dpp_to_jsonld(self, minimal_dpp_data: dict):
+    def test_dpp_to_jsonld(self, base_dpp: DigitalProductPassport):
         """Test JSON-LD serialization."""
-        dpp = DigitalProductPassport(**minimal_dpp_data)
-        jsonld = dpp.to_jsonld(include_context=True)
+        jsonld = base_dpp.to_jsonld(include_context=True)
         assert "@context" in jsonld
         assert "DigitalProductPassport" in jsonld["type"]
 
@@ -178,32 +299,23 @@ class TestDigitalProductPassport:
 class TestEnums:
     """Tests for enumeration types."""
 
-    def test_conformity_topic_values(self):
-        """Test ConformityTopic enum values."""
-        assert ConformityTopic.ENVIRONMENT_EMISSIONS.value == "environment.emissions"
-        assert ConformityTopic.SOCIAL_LABOUR.value == "social.labour"
-
-    def test_granularity_level_values(self):
-        """Test GranularityLevel enum values."""
-        assert GranularityLevel.ITEM.value == "item"
-        assert GranularityLevel.BATCH.value == "batch"
-        assert GranularityLevel.MODEL.value == "model"
-
-    def test_operational_scope_values(self):
-        """Test OperationalScope enum values."""
-        assert OperationalScope.CRADLE_TO_GATE.value == "CradleToGate"
-
-    def test_hash_method_values(self):
-        """Test HashMethod enum values."""
-        assert HashMethod.SHA_256.value == "SHA-256"
-
-    def test_encryption_method_values(self):
-        """Test EncryptionMethod enum values."""
-        assert EncryptionMethod.AES.value == "AES"
-
-    def test_criterion_status_values(self):
-        """Test CriterionStatus enum values."""
-        assert CriterionStatus.ACTIVE.value == "active"
+    @pytest.mark.parametrize(
+        ("member", "value"),
+        [
+            (ConformityTopic.ENVIRONMENT_EMISSIONS, "environment.emissions"),
+            (ConformityTopic.SOCIAL_LABOUR, "social.labour"),
+            (GranularityLevel.ITEM, "item"),
+            (GranularityLevel.BATCH, "batch"),
+            (GranularityLevel.MODEL, "model"),
+            (OperationalScope.CRADLE_TO_GATE, "CradleToGate"),
+            (HashMethod.SHA_256, "SHA-256"),
+            (EncryptionMethod.AES, "AES"),
+            (CriterionStatus.ACTIVE, "active"),
+        ],
+    )
+    def test_enum_values(self, member, value):
+        """Test serialized enum values."""
+        assert member.value == value
 
 
 class TestLink:
@@ -211,27 +323,22 @@ class TestLink:
 
     def test_link_with_url(self):
         """Test creating a link with URL."""
-        link = Link(link_url="https://example.com/doc")
+        link = _make(Link, link_url="https://example.com/doc")
         assert str(link.link_url) == "https://example.com/doc"
 
     def test_link_with_name(self):
         """Test link with display name."""
-        link = Link(link_url="https://example.com/doc", link_name="Documentation")
+        link = _make(Link, link_url="https://example.com/doc", link_name="Documentation")
         assert link.link_name == "Documentation"
 
-    def test_link_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        link = Link(link_url="https://example.com/doc")
-        jsonld = link.to_jsonld()
-        assert jsonld["type"] == ["Link"]
-
 
 class TestSecureLink:
     """Tests for SecureLink model."""
 
     def test_secure_link_with_hash(self):
         """Test secure link with hash."""
-        link = SecureLink(
+        link = _make(
+            SecureLink,
             link_url="https://example.com/file.pdf",
             hash_digest="abc123",
             hash_method=HashMethod.SHA_256,
@@ -239,20 +346,14 @@ class TestSecureLink:
         assert link.hash_digest == "abc123"
         assert link.hash_method == HashMethod.SHA_256
 
-    def test_secure_link_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        link = SecureLink(link_url="https://example.com/file.pdf")
-        jsonld = link.to_jsonld()
-        assert "SecureLink" in jsonld["type"]
-        assert "Link" in jsonld["type"]
-
 
 class TestClassification:
     """Tests for Classification model."""
 
     def test_valid_classification(self):
         """Test creating a valid classification."""
-        classification = Classification(
+        classification = _make(
+            Classification,
             id="https://vocabulary.example.com/class/001",
             name="Electronics",
             code="ELEC",
@@ -260,40 +361,27 @@ class TestClassification:
         assert classification.name == "Electronics"
         assert classification.code == "ELEC"
 
-    def test_classification_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        classification = Classification(
-            id="https://vocabulary.example.com/class/001",
-            name="Electronics",
-        )
-        jsonld = classification.to_jsonld()
-        assert jsonld["type"] == ["Classification"]
-
 
 class TestIdentifierScheme:
     """Tests for IdentifierScheme model."""
 
     def test_valid_identifier_scheme(self):
         """Test creating a valid identifier scheme."""
-        scheme = IdentifierScheme(
+        scheme = _make(
+            IdentifierScheme,
             id="https://id.gs1.org/",
             name="GS1 Global Trade Item Number",
         )
         assert scheme.name == "GS1 Global Trade Item Number"
 
-    def test_identifier_scheme_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        scheme = IdentifierScheme(name="DUNS")
-        jsonld = scheme.to_jsonld()
-        assert jsonld["type"] == ["IdentifierScheme"]
-
 
 class TestParty:
     """Tests for Party model."""
 
     def test_valid_party(self):
         """Test creating a valid party."""
-        party = Party(
+        party = _make(
+            Party,
             id="https://example.com/parties/001",
             name="Example Corporation",
         )
@@ -301,44 +389,35 @@ class TestParty:
 
     def test_party_with_registered_id(self):
         """Test party with registered ID."""
-        party = Party(
+        party = _make(
+            Party,
             id="https://example.com/parties/001",
             name="Example Corp",
             registered_id="REG-12345",
         )
         assert party.registered_id == "REG-12345"
 
-    def test_party_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        party = Party(id="https://example.com/parties/001", name="Corp")
-        jsonld = party.to_jsonld()
-        assert jsonld["type"] == ["Party"]
-
 
 class TestFacility:
     """Tests for Facility model."""
 
     def test_valid_facility(self):
         """Test creating a valid facility."""
-        facility = Facility(
+        facility = _make(
+            Facility,
             id="https://example.com/facilities/001",
             name="Manufacturing Plant A",
         )
         assert facility.name == "Manufacturing Plant A"
 
-    def test_facility_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        facility = Facility(id="https://example.com/facilities/001", name="Plant A")
-        jsonld = facility.to_jsonld()
-        assert jsonld["type"] == ["Facility"]
-
 
 class TestMetric:
     """Tests for Metric model."""
 
     def test_valid_metric(self):
         """Test creating a valid metric."""
-        metric = Metric(
+        metric = _make(
+            Metric,
             metric_name="Carbon Footprint",
             metric_value={"value": 25.5, "unit": "KGM"},
         )
@@ -347,7 +426,8 @@ class TestMetric:
 
     def test_metric_with_accuracy(self):
         """Test metric with accuracy."""
-        metric = Metric(
+        metric = _make(
+            Metric,
             metric_name="Energy Usage",
             metric_value={"value": 100, "unit": "KWH"},
             accuracy=0.95,
@@ -357,7 +437,8 @@ class TestMetric:
     def test_metric_accuracy_bounds(self):
         """Test metric accuracy must be 0-1."""
         with pytest.raises(ValidationError):
-            Metric(
+            _make(
+                Metric,
                 metric_name="Test",
                 metric_value={"value": 1, "unit": "EA"},
                 accuracy=1.5,
@@ -369,7 +450,8 @@ class TestEmissionsPerformance:
 
     def test_valid_emissions(self):
         """Test creating valid emissions performance."""
-        emissions = EmissionsPerformance(
+        emissions = _make(
+            EmissionsPerformance,
             carbon_footprint=25.5,
             declared_unit="KGM",
             operational_scope=OperationalScope.CRADLE_TO_GATE,
@@ -381,31 +463,22 @@ class TestEmissionsPerformance:
     def test_emissions_ratio_bounds(self):
         """Test primary sourced ratio must be 0-1."""
         with pytest.raises(ValidationError):
-            EmissionsPerformance(
+            _make(
+                EmissionsPerformance,
                 carbon_footprint=25.5,
                 declared_unit="KGM",
                 operational_scope=OperationalScope.CRADLE_TO_GATE,
                 primary_sourced_ratio=1.5,
             )
 
-    def test_emissions_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        emissions = EmissionsPerformance(
-            carbon_footprint=25.5,
-            declared_unit="KGM",
-            operational_scope=OperationalScope.CRADLE_TO_GATE,
-            primary_sourced_ratio=0.8,
-        )
-        jsonld = emissions.to_jsonld()
-        assert jsonld["type"] == ["EmissionsPerformance"]
-
 
 class TestCircularityPerformance:
     """Tests for CircularityPerformance model."""
 
     def test_valid_circularity(self):
         """Test creating valid circularity performance."""
-        circularity = CircularityPerformance(
+        circularity = _make(
+            CircularityPerformance,
             recyclable_content=0.85,
             recycled_content=0.3,
             utility_factor=1.2,
@@ -416,13 +489,7 @@ class TestCircularityPerformance:
     def test_circularity_content_bounds(self):
         """Test recyclable content must be 0-1."""
         with pytest.raises(ValidationError):
-            CircularityPerformance(recyclable_content=1.5)
-
-    def test_circularity_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        circularity = CircularityPerformance(recycled_content=0.3)
-        jsonld = circularity.to_jsonld()
-        assert jsonld["type"] == ["CircularityPerformance"]
+            _make(CircularityPerformance, recyclable_content=1.5)
 
 
 class TestTraceabilityPerformance:
@@ -430,26 +497,22 @@ class TestTraceabilityPerformance:
 
     def test_valid_traceability(self):
         """Test creating valid traceability performance."""
-        traceability = TraceabilityPerformance(
+        traceability = _make(
+            TraceabilityPerformance,
             value_chain_process="Manufacturing",
             verified_ratio=0.9,
         )
         assert traceability.value_chain_process == "Manufacturing"
         assert traceability.verified_ratio == 0.9
 
-    def test_traceability_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        traceability = TraceabilityPerformance(verified_ratio=0.8)
-        jsonld = traceability.to_jsonld()
-        assert jsonld["type"] == ["TraceabilityPerformance"]
-
 
 class TestCriterion:
     """Tests for Criterion model."""
 
     def test_valid_criterion(self):
         """Test creating a valid criterion."""
-        criterion = Criterion(
+        criterion = _make(
+            Criterion,
             id="https://example.com/criteria/001",
             name="Energy Efficiency",
             description="Minimum energy efficiency requirements",
@@ -459,25 +522,14 @@ class TestCriterion:
         assert criterion.name == "Energy Efficiency"
         assert criterion.conformity_topic == ConformityTopic.ENVIRONMENT_ENERGY
 
-    def test_criterion_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        criterion = Criterion(
-            id="https://example.com/criteria/001",
-            name="Test",
-            description="Test criterion",
-            conformity_topic=ConformityTopic.ENVIRONMENT_ENERGY,
-            status=CriterionStatus.ACTIVE,
-        )
-        jsonld = criterion.to_jsonld()
-        assert jsonld["type"] == ["Criterion"]
-
 
 class TestStandard:
     """Tests for Standard model."""
 
     def test_valid_standard(self):
         """Test creating a valid standard."""
-        standard = Standard(
+        standard = _make(
+            Standard,
             id="https://iso.org/14001",
             name="ISO 14001",
             issuing_party={
@@ -487,22 +539,14 @@ class TestStandard:
         )
         assert standard.name == "ISO 14001"
 
-    def test_standard_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        standard = Standard(
-            name="ISO 14001",
-            issuing_party={"id": "https://iso.org", "name": "ISO"},
-        )
-        jsonld = standard.to_jsonld()
-        assert jsonld["type"] == ["Standard"]
-
 
 class TestRegulation:
     """Tests for Regulation model."""
 
     def test_valid_regulation(self):
         """Test creating a valid regulation."""
-        regulation = Regulation(
+        regulation = _make(
+            Regulation,
             id="https://ec.europa.eu/espr",
             name="EU ESPR",
             administered_by={
@@ -514,22 +558,14 @@ class TestRegulation:
         assert regulation.name == "EU ESPR"
         assert regulation.jurisdiction_country == "EU"
 
-    def test_regulation_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        regulation = Regulation(
-            name="ESPR",
-            administered_by={"id": "https://ec.europa.eu", "name": "EC"},
-        )
-        jsonld = regulation.to_jsonld()
-        assert jsonld["type"] == ["Regulation"]
-
 
 class TestClaim:
     """Tests for Claim model."""
 
     def test_valid_claim(self):
         """Test creating a valid claim."""
-        claim = Claim(
+        claim = _make(
+            Claim,
             id="https://example.com/claims/001",
             conformance=True,
             conformity_topic=ConformityTopic.ENVIRONMENT_EMISSIONS,
@@ -537,61 +573,41 @@ class TestClaim:
         assert claim.conformance is True
         assert claim.conformity_topic == ConformityTopic.ENVIRONMENT_EMISSIONS
 
-    def test_claim_to_jsonld(self):
-        """Test JSON-LD serialization has both types."""
-        claim = Claim(
-            id="https://example.com/claims/001",
-            conformance=True,
-            conformity_topic=ConformityTopic.ENVIRONMENT_EMISSIONS,
-        )
-        jsonld = claim.to_jsonld()
-        assert "Claim" in jsonld["type"]
-        assert "Declaration" in jsonld["type"]
-
 
 class TestProductPassport:
     """Tests for ProductPassport model."""
 
     def test_valid_product_passport(self):
         """Test creating a valid product passport."""
-        passport = ProductPassport(
+        passport = _make(
+            ProductPassport,
             id="https://example.com/passports/001",
             granularity_level=GranularityLevel.ITEM,
         )
         assert passport.granularity_level == GranularityLevel.ITEM
 
-    def test_product_passport_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        passport = ProductPassport()
-        jsonld = passport.to_jsonld()
-        assert jsonld["type"] == ["ProductPassport"]
-
 
 class TestDimension:
     """Tests for Dimension model."""
 
     def test_valid_dimension(self):
         """Test creating a valid dimension."""
-        dimension = Dimension(
+        dimension = _make(
+            Dimension,
             length={"value": 100, "unit": "CMT"},
             width={"value": 50, "unit": "CMT"},
             height={"value": 25, "unit": "CMT"},
         )
         assert dimension.length.value == 100
 
-    def test_dimension_to_jsonld(self):
-        """Test JSON-LD serialization."""
-        dimension = Dimension()
-        jsonld = dimension.to_jsonld()
-        assert jsonld["type"] == ["Dimension"]
-
 
 class TestCredentialStatus:
     """Tests for CredentialStatus model (W3C VC v2 revocation)."""
 
     def test_valid_credential_status(self):
         """Test creating a valid credential status."""
-        status = CredentialStatus(
+        status = _make(
+            CredentialStatus,
             id="https://example.com/status/1#42",
             type="BitstringStatusListEntry",
             status_purpose="revocation",
@@ -605,7 +621,8 @@ class TestCredentialStatus:
 
     def test_credential_status_minimal(self):
         """Test minimal credential status with only required fields."""
-        status = CredentialStatus(
+        status = _make(
+            CredentialStatus,
             id="https://example.com/status/1",
             type="StatusList2021Entry",
         )
@@ -617,7 +634,8 @@ class TestCredentialStatus:
 
     def test_credential_status_to_jsonld(self):
         """Test JSON-LD serialization."""
-        status = CredentialStatus(
+        status = _make(
+            CredentialStatus,
             id="https://example.com/status/1#42",
             type="BitstringStatusListEntry",
             status_purpose="revocation",
@@ -630,7 +648,7 @@ class TestCredentialStatus:
     def test_credential_status_missing_required_fields(self):
         """Test that required fields are enforced."""
         with pytest.raises(ValidationError):
-            CredentialStatus(id="https://example.com/status")  # missing type
+            _make(CredentialStatus, id="https://example.com/status")  # missing type
 
 
 class TestDigitalProductPassportCredentialStatus:
@@ -638,7 +656,8 @@ class TestDigitalProductPassportCredentialStatus:
 
     def test_passport_with_single_credential_status(self):
         """Test passport with single credential status."""
-        passport = DigitalProductPassport(
+        passport = _make(
+            DigitalProductPassport,
             id="https://example.com/dpp/001",
             issuer={"id": "did:web:example.com", "name": "Issuer"},
             credentialStatus={
@@ -652,7 +671,8 @@ class TestDigitalProductPassportCredentialStatus:
 
     def test_passport_with_multiple_credential_statuses(self):
         """Test passport with list of credential statuses."""
-        passport = DigitalProductPassport(
+        passport = _make(
+            DigitalProductPassport,
             id="https://example.com/dpp/001",
             issuer={"id": "did:web:example.com", "name": "Issuer"},
             credentialStatus=[
@@ -675,7 +695,8 @@ class TestDigitalProductPassportCredentialStatus:
 
     def test_passport_without_credential_status(self):
         """Test passport without credential status (optional field)."""
-        passport = DigitalProductPassport(
+        passport = _make(
+            DigitalProductPassport,
             id="https://example.com/dpp/001",
             issuer={"id": "did:web:example.com", "name": "Issuer"},
         )